@@ -18,7 +18,9 @@ from adotypes.api_objects import (  # noqa
     DateFromTicks,
     TimeFromTicks,
     TimestampFromTicks,
+    Binary,
 )
+from adotypes.com_thread import ThreadedConnection, ThreadedCursor  # noqa
 from adotypes.api_globals import (  # noqa
     apilevel,
     threadsafety,
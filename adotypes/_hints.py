@@ -1,5 +1,5 @@
-from collections.abc import Mapping, Sequence
-from typing import Optional, Protocol, TypeVar, Union
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from typing import Any, Optional, Protocol, TypeVar, Union
 
 
 _T_co = TypeVar("_T_co", covariant=True)
@@ -26,3 +26,7 @@ _ColumnDescription = tuple[
 
 _InputSizes = Union[int, Sequence[Optional[int]]]
 _OutputSize = Union[int, tuple[int, Optional[int]]]
+
+# takes the description of a result set and returns a callable that builds
+# a row from an iterable of the values of its columns
+_RowFactory = Callable[[list[_ColumnDescription]], Callable[[Iterable[Any]], Any]]
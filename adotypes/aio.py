@@ -0,0 +1,261 @@
+import asyncio
+from collections.abc import Callable, Iterable, MutableMapping
+from concurrent.futures import Future
+import functools
+import logging
+import types
+from typing import Any, Optional, TypeVar
+import weakref
+
+from adotypes import tracing
+from adotypes._hints import _Parameters, _ColumnDescription, _RowFactory
+from adotypes.api_constructors import _connect
+from adotypes.api_objects import Connection, Cursor
+from adotypes.com_thread import ComThread, _BlockPrefetcher
+
+LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+async def connect(*, blocksize: int = 100, **kwargs: Any) -> "AsyncConnection":
+    """Opens a connection on a dedicated COM thread without blocking the
+    event loop.
+
+    Takes the same keyword arguments as `adotypes.connect`.
+    """
+    worker = ComThread()
+    try:
+        conn = await asyncio.wrap_future(
+            worker.submit(functools.partial(_connect, **kwargs))
+        )
+    except BaseException:
+        worker.stop(wait=False)
+        raise
+    return AsyncConnection(worker, conn, blocksize=blocksize)
+
+
+class AsyncConnection:
+    """An awaitable front-end of a `Connection` living on a `ComThread`."""
+
+    blocksize: int
+
+    def __init__(
+        self, worker: ComThread, connection: Connection, blocksize: int = 100
+    ) -> None:
+        self.blocksize = blocksize
+        self._worker = worker
+        self._connection = connection
+        self._cursors: MutableMapping[
+            int, "AsyncCursor"
+        ] = weakref.WeakValueDictionary()
+
+    def _run(self, fn: Callable[..., _T], *args: Any) -> "asyncio.Future[_T]":
+        return asyncio.wrap_future(self._worker.submit(fn, *args))
+
+    async def close(self) -> None:
+        if not hasattr(self, "_connection"):
+            LOGGER.debug("%r has been closed", self)
+            return
+        cursors = list(self._cursors.values())
+        for c in cursors:
+            await c.close()
+        del cursors
+        await self._run(self._release)
+        self._worker.stop(wait=False)
+        LOGGER.debug("complete closing %r", self)
+
+    def _release(self) -> None:
+        # see `ThreadedConnection._release`
+        self._connection.close()
+        del self._connection
+
+    async def commit(self) -> None:
+        await self._run(self._connection.commit)
+
+    async def rollback(self) -> None:
+        await self._run(self._connection.rollback)
+
+    async def cursor(self) -> "AsyncCursor":
+        return AsyncCursor(self, await self._run(self._connection.cursor))
+
+    async def run(self, fn: Callable[..., _T], *args: Any) -> _T:
+        """Runs `fn(connection, *args)` on the worker thread."""
+        return await self._run(fn, self._connection, *args)
+
+    async def get_stats(self) -> tracing.Stats:
+        """Returns `Connection.stats`, read on the worker thread."""
+        return await self._run(getattr, self._connection, "stats")
+
+    @property
+    def row_factory(self) -> Optional[_RowFactory]:
+        return self._connection.row_factory
+
+    @row_factory.setter
+    def row_factory(self, factory: Optional[_RowFactory]) -> None:
+        self._connection.row_factory = factory
+
+    def __del__(self) -> None:
+        if hasattr(self, "_connection"):
+            self._worker.submit(self._connection.close)
+            self._worker.stop(wait=False)
+
+    async def __aenter__(self) -> "AsyncConnection":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[Exception]],
+        exc_val: Optional[Exception],
+        exc_tb: Optional[types.TracebackType],
+    ) -> None:
+        if exc_type:
+            await self.rollback()
+        else:
+            await self.commit()
+
+    def register_cursor(self, cursor: "AsyncCursor") -> None:
+        self._cursors[hash(cursor)] = cursor
+        LOGGER.debug("%r is registered", cursor)
+
+    def unregister_cursor(self, cursor: "AsyncCursor") -> None:
+        del self._cursors[hash(cursor)]
+        LOGGER.debug("%r is unregistered", cursor)
+
+    def __repr__(self) -> str:
+        return f"<AsyncConnection object at {id(self):#016x}>"
+
+
+class AsyncCursor:
+    """An awaitable front-end of a `Cursor` living on a `ComThread`.
+
+    `async for` fetches rows in blocks of `blocksize`; the next block is
+    fetched on the worker thread while the current one is being iterated.
+    """
+
+    arraysize: int
+
+    def __init__(self, connection: AsyncConnection, cursor: Cursor) -> None:
+        self.arraysize = 1
+        self._connection = connection
+        self._cursor = cursor
+        self._blocks = _BlockPrefetcher(
+            connection._worker, cursor, connection.blocksize
+        )
+        self._connection.register_cursor(self)
+
+    @property
+    def blocksize(self) -> int:
+        return self._blocks.blocksize
+
+    @blocksize.setter
+    def blocksize(self, size: int) -> None:
+        self._blocks.blocksize = size
+
+    @property
+    def row_factory(self) -> Optional[_RowFactory]:
+        return self._cursor.row_factory
+
+    @row_factory.setter
+    def row_factory(self, factory: Optional[_RowFactory]) -> None:
+        self._cursor.row_factory = factory
+
+    async def get_description(self) -> Optional[list[_ColumnDescription]]:
+        """Returns `Cursor.description`, read on the worker thread."""
+        return await self._connection._run(getattr, self._cursor, "description")
+
+    async def get_rowcount(self) -> int:
+        """Returns `Cursor.rowcount`, read on the worker thread."""
+        return await self._connection._run(getattr, self._cursor, "rowcount")
+
+    async def close(self) -> None:
+        if not hasattr(self, "_connection"):
+            LOGGER.debug("%r has been closed", self)
+            return
+        await self._connection._run(self._release)
+        self._connection.unregister_cursor(self)
+        del self._connection
+        LOGGER.debug("complete closing %r", self)
+
+    def _release(self) -> None:
+        self._blocks.release()
+        self._cursor.close()
+        del self._cursor
+
+    async def execute(
+        self, operation: str, parameters: Optional[_Parameters[Any]] = None
+    ) -> None:
+        self._blocks.reset()
+        await self._connection._run(self._cursor.execute, operation, parameters)
+        self._blocks.start()
+
+    async def executemany(
+        self, operation: str, seq_of_parameters: Iterable[_Parameters[Any]]
+    ) -> None:
+        self._blocks.reset()
+        await self._connection._run(
+            self._cursor.executemany, operation, seq_of_parameters
+        )
+        self._blocks.start()
+
+    async def fetchone(self) -> Optional[Any]:
+        if not self._blocks.rows and not await self._fill():
+            return None
+        return self._blocks.rows.popleft()
+
+    async def fetchmany(self, size: Optional[int] = None) -> list[Any]:
+        size = self.arraysize if size is None else size
+        while len(self._blocks.rows) < size and await self._fill():
+            pass
+        return self._blocks.take(size)
+
+    async def fetchall(self) -> list[Any]:
+        while (fut := self._blocks.remaining()) is not None:
+            await self._wait(fut)
+            self._blocks.accept(prefetch=False)
+        return self._blocks.take()
+
+    async def _fill(self) -> bool:
+        """Waits for the next block and queues the one after it."""
+        if (fut := self._blocks.next_block()) is None:
+            return False
+        await self._wait(fut)
+        return self._blocks.accept()
+
+    async def _wait(self, fut: "Future[list[Any]]") -> None:
+        # shielded, since cancelling the wrapper would cancel the block too;
+        # the block stays pending, so the next call takes it in.
+        await asyncio.shield(asyncio.wrap_future(fut))
+
+    def __del__(self) -> None:
+        if hasattr(self, "_cursor") and hasattr(self, "_connection"):
+            # the request holds the last reference to this cursor, so the
+            # wrapped cursor is released on the worker thread.
+            self._connection._worker.submit(self._release)
+
+    def __aiter__(self) -> "AsyncCursor":
+        return self
+
+    async def __anext__(self) -> Any:
+        if not self._blocks.rows and not await self._fill():
+            raise StopAsyncIteration
+        return self._blocks.rows.popleft()
+
+    async def __aenter__(self) -> "AsyncCursor":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[Exception]],
+        exc_val: Optional[Exception],
+        exc_tb: Optional[types.TracebackType],
+    ) -> None:
+        await self.close()
+
+    @property
+    def connection(self) -> AsyncConnection:
+        return self._connection
+
+    def __repr__(self) -> str:
+        return f"<AsyncCursor object at {id(self):#016x}>"
+
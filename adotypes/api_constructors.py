@@ -1,32 +1,63 @@
+import functools
 import logging
-from typing import Any, NoReturn, Optional, overload
+import time
+from typing import Any, Literal, NoReturn, Optional, Union, overload
 
 import comtypes.client
 
-from adotypes import com_dlls, api_exceptions as exc
+from adotypes import com_dlls, tracing, api_exceptions as exc
 from adotypes.api_objects import Connection
+from adotypes.com_thread import ThreadedConnection
 
 LOGGER = logging.getLogger(__name__)
 
-
 # fmt: off
 @overload
-def connect(*, create: str, **kwargs: Any) -> Connection: ...  # noqa
+def connect(*, create: str, threaded: Literal[False] = ..., **kwargs: Any) -> Connection: ...  # noqa
+@overload
+def connect(*, create: str, threaded: Literal[True], blocksize: int = ..., **kwargs: Any) -> ThreadedConnection: ...  # noqa
+@overload
+def connect(*, open: str, user_id: str = ..., passward: str = ..., options: str = ..., threaded: Literal[False] = ..., **kwargs: Any) -> Connection: ...  # noqa
 @overload
-def connect(*, open: str, user_id: str = ..., passward: str = ..., options: str = ..., **kwargs: Any) -> Connection: ...  # noqa
+def connect(*, open: str, user_id: str = ..., passward: str = ..., options: str = ..., threaded: Literal[True], blocksize: int = ..., **kwargs: Any) -> ThreadedConnection: ...  # noqa
 @overload
 def connect(*, create: str, open: str, **kwargs: Any) -> NoReturn: ...  # noqa
 # fmt: on
 
 
-def connect(**kwargs: Any) -> Connection:
-    conn, kw = _new_adodb_connection(**kwargs)
-    return Connection(conn, **kw)
+def connect(
+    *, threaded: bool = False, **kwargs: Any
+) -> Union[Connection, ThreadedConnection]:
+    if threaded:
+        blocksize = kwargs.pop("blocksize", 100)
+        factory = functools.partial(_connect, **kwargs)
+        return ThreadedConnection(factory, blocksize=blocksize)
+    return _connect(**kwargs)
+
+
+def _connect(**kwargs: Any) -> Connection:
+    hooked = bool(tracing._HOOKS)
+    if hooked:
+        tracing._before("connect", None)
+    start = time.perf_counter()
+    try:
+        conn, kw, com_calls = _new_adodb_connection(**kwargs)
+    except Exception as e:
+        if hooked:
+            elapsed = time.perf_counter() - start
+            tracing._after("connect", None, None, elapsed, None, 0, e)
+        raise
+    connection = Connection(conn, **kw)
+    com_calls += 1  # `BeginTrans` in `Connection.__init__`
+    connection._record("connect", start, com_calls, hooked)
+    return connection
 
 
 def _new_adodb_connection(
     create: Optional[str] = None, open: Optional[str] = None, **kwargs: Any
-) -> tuple[com_dlls.adodb._Connection, dict[str, Any]]:
+) -> tuple[com_dlls.adodb._Connection, dict[str, Any], int]:
+    """Returns a new ADO connection, the unused keyword arguments and the
+    number of COM calls made."""
     if create and open:
         raise TypeError
     if create:
@@ -38,7 +69,8 @@ def _new_adodb_connection(
             catalog.Create(create)
             conn = catalog.ActiveConnection.QueryInterface(com_dlls.adodb._Connection)
             LOGGER.debug("complete creating a new db using adox")
-            return (conn, kwargs)
+            # `CreateObject`, `Create`, `ActiveConnection` and `QueryInterface`
+            return (conn, kwargs, 4)
         except Exception as e:
             LOGGER.error(str(e), stack_info=True)
             raise exc.ProgrammingError from e
@@ -53,7 +85,7 @@ def _new_adodb_connection(
             options = kwargs.pop("options", com_dlls.adodb.adConnectUnspecified)
             conn.Open(open, user_id, passward, options)
             LOGGER.debug("complete opening connection to an existing db using adodb")
-            return (conn, kwargs)
+            return (conn, kwargs, 2)  # `CreateObject` and `Open`
         except Exception as e:
             LOGGER.error(str(e), stack_info=True)
             raise exc.ProgrammingError from e
@@ -1,68 +1,129 @@
-from collections.abc import Iterable, MutableMapping, Sequence
+from collections.abc import Callable, Iterable, Mapping, MutableMapping, Sequence
+import datetime
 import enum
 import logging
+import time
 import types
 from typing import Any, Optional, SupportsIndex, Union
 import weakref
 
 import comtypes.client
 
-from adotypes import com_dlls, api_exceptions as exc
-from adotypes._hints import _Parameters, _ColumnDescription, _InputSizes, _OutputSize
+from adotypes import com_dlls, encoders, tracing, api_exceptions as exc
+from adotypes._hints import (
+    _Parameters,
+    _ColumnDescription,
+    _InputSizes,
+    _OutputSize,
+    _RowFactory,
+)
 
 LOGGER = logging.getLogger(__name__)
 
+# `Type`, `Size`, and `Precision` and `NumericScale` of a parameter
+_Shape = tuple[int, int, Optional[tuple[int, int]]]
+
+
+def _shape(ad_type: int, size: int, value: Any) -> _Shape:
+    if ad_type == com_dlls.adodb.adDecimal:
+        return (ad_type, size, encoders.decimal_digits(value))
+    return (ad_type, size, None)
+
 
 class Connection:
+    row_factory: Optional[_RowFactory]
+
     def __init__(self, connector: com_dlls.adodb._Connection, **kwargs: Any) -> None:
+        self.row_factory = None
         self._trns_lv = 0
         self._connector = connector
         # THIS MUST BE `weakref.WeakValueDictionary`!
         # If this were a built-in list or dictionary, COM objects would cause
         # a serious and tragic memory leak!
         self._cursors: MutableMapping[int, "Cursor"] = weakref.WeakValueDictionary()
+        self._stats = tracing._Statistics()
         self._trns_lv: int = self._connector.BeginTrans()
 
     def close(self) -> None:
         if not self._trns_lv:
-            LOGGER.debug(f"{self!r} has been closed")
+            LOGGER.debug("%r has been closed", self)
             return
-        self._rollback()
-        cursors = iter(self._cursors.values())
+        self._rollback(restart=False)
+        # `Cursor.close` unregisters the cursor, so iterate over a copy
+        cursors = list(self._cursors.values())
         for c in cursors:
             c.close()
         del cursors
         self._connector.Close()
         del self._connector
         self._trns_lv = 0
-        LOGGER.debug(f"complete closing {self!r}")
+        LOGGER.debug("complete closing %r", self)
 
     def commit(self) -> None:
+        hooked = bool(tracing._HOOKS)
+        if hooked:
+            tracing._before("commit", self)
+        start = time.perf_counter()
+        com_calls = 1
         try:
             self._connector.CommitTrans()
         except Exception as e:
             LOGGER.error(str(e), stack_info=True)
-            raise exc.ProgrammingError from e
+            error = exc.ProgrammingError()
+            self._record("commit", start, com_calls, hooked, error=error)
+            raise error from e
         LOGGER.debug("commit is done")
+        com_calls += 1
         self._trns_lv = self._connector.BeginTrans()
+        self._record("commit", start, com_calls, hooked)
 
     def rollback(self) -> None:
         if not self._trns_lv:
             LOGGER.debug("transaction has not started")
             return
-        self._rollback()
-        self._trns_lv = self._connector.BeginTrans()
+        self._rollback(restart=True)
 
     def cursor(self) -> "Cursor":
         return Cursor(self)
 
-    def _rollback(self) -> None:
+    def _rollback(self, restart: bool) -> None:
+        hooked = bool(tracing._HOOKS)
+        if hooked:
+            tracing._before("rollback", self)
+        start = time.perf_counter()
+        com_calls = 1
         try:
             self._connector.RollbackTrans()
         except Exception as e:
             LOGGER.error(str(e), stack_info=True)
-            raise exc.ProgrammingError from e
+            error = exc.ProgrammingError()
+            self._record("rollback", start, com_calls, hooked, error=error)
+            raise error from e
         LOGGER.debug("rollback is done")
+        if restart:
+            com_calls += 1
+            self._trns_lv = self._connector.BeginTrans()
+        self._record("rollback", start, com_calls, hooked)
+
+    def _record(
+        self,
+        kind: str,
+        start: float,
+        com_calls: int,
+        hooked: bool,
+        statement: Optional[str] = None,
+        rows: Optional[int] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        elapsed = time.perf_counter() - start
+        self._stats.record(kind, elapsed, com_calls, rows or 0)
+        if hooked:
+            tracing._after(kind, self, statement, elapsed, rows, com_calls, error)
+
+    @property
+    def stats(self) -> tracing.Stats:
+        """A snapshot of the statistics of the operations on this connection."""
+        return self._stats.snapshot()
 
     def __del__(self) -> None:
         self.close()
@@ -83,12 +144,11 @@ class Connection:
 
     def register_cursor(self, cursor: "Cursor") -> None:
         self._cursors[hash(cursor)] = cursor
-        LOGGER.debug(f"{cursor!r} is registered")
+        LOGGER.debug("%r is registered", cursor)
 
     def unregister_cursor(self, cursor: "Cursor") -> None:
-        repr_ = repr(cursor)
         del self._cursors[hash(cursor)]
-        LOGGER.debug(f"{repr_} is unregistered")
+        LOGGER.debug("%r is unregistered", cursor)
 
     @property
     def ado_connection(self) -> com_dlls.adodb._Connection:
@@ -108,15 +168,34 @@ class Connection:
 
 class Cursor:
     arraysize: int
+    row_factory: Optional[_RowFactory]
 
     def __init__(self, connection: Connection) -> None:
         self.arraysize = 1
+        self.row_factory = connection.row_factory
+        self._description: Optional[list[_ColumnDescription]] = None
+        # `row_factory` and the row builder it made for the current result set
+        self._maker: tuple[Optional[_RowFactory], Callable[[Iterable[Any]], Any]]
+        self._maker = (None, tuple)
+        # the `Field` objects of the current result set; their values follow
+        # the current record, so they are enumerated only once.
+        self._fields: Optional[list[com_dlls.adodb.Field]] = None
+        # COM calls made since the last operation was reported to `tracing`;
+        # those of `description` are reported with the next operation.
+        self._com_calls = 0
         self._connection = connection
         self._connection.register_cursor(self)
 
     @property
-    def description(self) -> list[_ColumnDescription]:
-        raise NotImplementedError
+    def description(self) -> Optional[list[_ColumnDescription]]:
+        if self._description is None:
+            if not hasattr(self, "_rs"):
+                return None
+            self._com_calls += 1
+            if self._rs.State == com_dlls.adodb.adStateClosed:
+                return None
+            self._description = [self._describe(f) for f in self._get_fields()]
+        return self._description
 
     @property
     def rowcount(self) -> int:
@@ -124,23 +203,103 @@ class Cursor:
 
     def close(self) -> None:
         if not hasattr(self, "_connection"):
-            LOGGER.debug(f"{self!r} has been closed")
+            LOGGER.debug("%r has been closed", self)
             return
         if hasattr(self, "_rs"):
             if self._rs.State != com_dlls.adodb.adStateClosed:
                 self._rs.Close()
             del self._rs
+        self._fields = None
         self._connection.unregister_cursor(self)
         del self._connection
-        LOGGER.debug(f"complete closing {self!r}")
+        LOGGER.debug("complete closing %r", self)
 
     def execute(
         self, operation: str, parameters: Optional[_Parameters[Any]] = None
     ) -> None:
-        cmd = self._create_command(operation)
+        hooked = bool(tracing._HOOKS)
+        if hooked:
+            tracing._before("execute", self._connection, operation)
+        start = time.perf_counter()
         try:
-            ptr_records_affected, _rs = cmd.Execute()
+            encoded = _encode_parameters(parameters)
+            cmd = self._create_command(operation)
+            self._append_parameters(cmd, encoded)
+            rs = self._execute_command(cmd, operation, parameters)
         except Exception as e:
+            raise self._failed(e, start, hooked, operation, parameters)
+        self._record("execute", start, hooked, operation)
+        self._set_recordset(rs)
+
+    def executemany(
+        self, operation: str, seq_of_parameters: Iterable[_Parameters[Any]]
+    ) -> None:
+        hooked = bool(tracing._HOOKS)
+        if hooked:
+            tracing._before("execute", self._connection, operation)
+        start = time.perf_counter()
+        # the command is prepared once, then only the values of its
+        # parameters are replaced for each row.
+        try:
+            cmd = self._create_command(operation, prepared=True)
+        except Exception as e:
+            raise self._failed(e, start, hooked, operation, None)
+        bound: list[Any] = []
+        shapes: list[_Shape] = []  # the current shape of each of `bound`
+        rs = None
+        for parameters in seq_of_parameters:
+            try:
+                encoded = _encode_parameters(parameters)
+                if rs is None:
+                    bound = self._append_parameters(cmd, encoded)
+                    shapes = [_shape(*e) for e in encoded]
+                else:
+                    self._update_parameters(bound, shapes, encoded)
+                rs = self._execute_command(cmd, operation, parameters)
+            except Exception as e:
+                raise self._failed(e, start, hooked, operation, parameters)
+        self._record("execute", start, hooked, operation)
+        # nothing was executed for an empty sequence, so no result set is left
+        self._set_recordset(rs)
+
+    def _set_recordset(self, rs: Optional[com_dlls.adodb._Recordset]) -> None:
+        if rs is not None:
+            self._rs = rs
+        elif hasattr(self, "_rs"):
+            del self._rs
+        self._fields = None
+        self._description = None
+        self._maker = (None, tuple)
+
+    def _record(
+        self,
+        kind: str,
+        start: float,
+        hooked: bool,
+        statement: Optional[str] = None,
+        rows: Optional[int] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        self._connection._record(
+            kind, start, self._com_calls, hooked, statement, rows, error
+        )
+        self._com_calls = 0
+
+    def _failed(
+        self,
+        e: Exception,
+        start: float,
+        hooked: bool,
+        operation: str,
+        parameters: Optional[_Parameters[Any]],
+    ) -> exc.Error:
+        """Records the failure of "execute" and returns the error to raise.
+
+        Errors raised by COM are wrapped in `DatabaseError`.
+        """
+        if isinstance(e, exc.Error):
+            error = e
+        else:
             msg = (
                 "failure;\n"
                 f"msg: {e};\n"
@@ -148,39 +307,95 @@ class Cursor:
                 f"params: {parameters!r}"
             )
             LOGGER.error(msg, stack_info=True)
-            raise exc.DatabaseError(msg) from e
+            error = exc.DatabaseError(msg)
+            error.__cause__ = e
+        self._record("execute", start, hooked, operation, error=error)
+        return error
+
+    def _execute_command(
+        self,
+        cmd: com_dlls.adodb._Command,
+        operation: str,
+        parameters: Optional[_Parameters[Any]],
+    ) -> com_dlls.adodb._Recordset:
+        self._com_calls += 1
+        ptr_records_affected, _rs = cmd.Execute()
+        self._com_calls += 1
         rs: com_dlls.adodb._Recordset = _rs.QueryInterface(com_dlls.adodb._Recordset)
         ra: int = ptr_records_affected[0].value
-        LOGGER.debug(f"success; cmd: {operation!r}; params: {parameters!r}")
-        LOGGER.debug(f"records affected is {ra}")
-        self._rs = rs
-
-    def executemany(
-        self, operation: str, seq_of_parameters: Iterable[_Parameters[Any]]
-    ) -> None:
-        raise NotImplementedError
-
-    def fetchone(self) -> Optional[tuple[Any, ...]]:
-        if self._rs.EOF:
-            return None
-        result = tuple(f.Value for f in self._rs.Fields)
-        self._rs.MoveNext()
-        return result
-
-    def fetchmany(self, size: Optional[int] = None) -> list[tuple[Any, ...]]:
-        size = self.arraysize if size is None else size
+        LOGGER.debug("success; cmd: %r; params: %r", operation, parameters)
+        LOGGER.debug("records affected is %d", ra)
+        return rs
+
+    def fetchone(self) -> Optional[Any]:
+        result = self._fetch(1)
+        return result[0] if result else None
+
+    def fetchmany(self, size: Optional[int] = None) -> list[Any]:
+        return self._fetch(self.arraysize if size is None else size)
+
+    def fetchall(self) -> list[Any]:
+        return self._fetch(None)
+
+    def _fetch(self, size: Optional[int]) -> list[Any]:
+        """Fetches a block of up to `size` rows, or all remaining rows."""
+        if not hasattr(self, "_rs"):
+            raise exc.ProgrammingError("no result set to fetch from")
+        hooked = bool(tracing._HOOKS)
+        if hooked:
+            tracing._before("fetch", self._connection)
+        start = time.perf_counter()
+        make = self._row_maker()
+        rs = self._rs
+        fields = self._fields
         result = []
-        cnt = 0
-        while cnt < size and (r := self.fetchone()) is not None:
-            result.append(r)
-            cnt += 1
+        while size is None or len(result) < size:
+            self._com_calls += 1
+            if rs.EOF:
+                break
+            if fields is None:
+                fields = self._get_fields()
+            # `Value` of each field, then `MoveNext`
+            self._com_calls += len(fields) + 1
+            result.append(make(f.Value for f in fields))
+            rs.MoveNext()
+        self._record("fetch", start, hooked, rows=len(result))
         return result
 
-    def fetchall(self) -> list[tuple[Any, ...]]:
-        result = []
-        while (r := self.fetchone()) is not None:
-            result.append(r)
-        return result
+    def _get_fields(self) -> list[com_dlls.adodb.Field]:
+        if self._fields is None:
+            self._com_calls += 1
+            fields = self._rs.Fields
+            # the enumerator of `Fields`, then one step of it for each field;
+            # `list(fields)` would also ask for `Count` as a length hint.
+            self._fields = [f for f in fields]
+            self._com_calls += 1 + len(self._fields)
+        return self._fields
+
+    def _describe(self, field: com_dlls.adodb.Field) -> _ColumnDescription:
+        nullable = com_dlls.adodb.adFldIsNullable | com_dlls.adodb.adFldMayBeNull
+        self._com_calls += 6  # the properties read below
+        return (
+            field.Name,
+            field.Type,
+            None,
+            field.DefinedSize,
+            field.Precision,
+            field.NumericScale,
+            bool(field.Attributes & nullable),
+        )
+
+    def _row_maker(self) -> Callable[[Iterable[Any]], Any]:
+        factory, make = self._maker
+        if factory is not self.row_factory:
+            factory = self.row_factory
+            description = None if factory is None else self.description
+            if factory is None or description is None:
+                make = tuple
+            else:
+                make = factory(description)
+            self._maker = (factory, make)
+        return make
 
     def setinputsizes(self, sizes: _InputSizes) -> None:
         raise NotImplementedError  # maybe does nothing
@@ -208,7 +423,10 @@ class Cursor:
     def connection(self) -> Connection:
         return self._connection
 
-    def _create_command(self, text: str) -> com_dlls.adodb._Command:
+    def _create_command(
+        self, text: str, prepared: bool = False
+    ) -> com_dlls.adodb._Command:
+        self._com_calls += 7  # `CreateObject`, `CommandTimeout` and the setters
         cmd = comtypes.client.CreateObject(
             com_dlls.adodb.Command, interface=com_dlls.adodb._Command
         )
@@ -216,13 +434,75 @@ class Cursor:
         cmd.CommandTimeout = self.connection.ado_connection.CommandTimeout
         cmd.CommandType = com_dlls.adodb.adCmdText
         cmd.CommandText = text
-        cmd.Prepared = False
+        cmd.Prepared = prepared
         return cmd
 
+    def _append_parameters(
+        self, cmd: com_dlls.adodb._Command, encoded: list[encoders._Encoded]
+    ) -> list[Any]:
+        if not encoded:
+            return []
+        self._com_calls += 1
+        params = cmd.Parameters
+        bound = []
+        for ad_type, size, value in encoded:
+            self._com_calls += 1
+            p = cmd.CreateParameter(
+                "", ad_type, com_dlls.adodb.adParamInput, size, value
+            )
+            if ad_type == com_dlls.adodb.adDecimal:
+                self._com_calls += 2
+                p.Precision, p.NumericScale = encoders.decimal_digits(value)
+            self._com_calls += 1
+            params.Append(p)
+            bound.append(p)
+        return bound
+
+    def _update_parameters(
+        self,
+        bound: list[Any],
+        shapes: list[_Shape],
+        encoded: list[encoders._Encoded],
+    ) -> None:
+        """Assigns `encoded` to the parameters bound by `_append_parameters`."""
+        if len(encoded) != len(bound):
+            raise exc.ProgrammingError(
+                f"expected {len(bound)} parameters, but got {len(encoded)}"
+            )
+        for i, (ad_type, size, value) in enumerate(encoded):
+            p = bound[i]
+            current_type, current_size, current_digits = shapes[i]
+            if ad_type != current_type:
+                self._com_calls += 1
+                p.Type = ad_type
+            if size > current_size:
+                self._com_calls += 1
+                p.Size = size
+            else:
+                size = current_size
+            digits = _shape(ad_type, size, value)[2]
+            if digits is not None and digits != current_digits:
+                self._com_calls += 2
+                p.Precision, p.NumericScale = digits
+            shapes[i] = (ad_type, size, digits)
+            self._com_calls += 1
+            p.Value = value
+
     def __repr__(self) -> str:
         return f"<Cursor object at {id(self):#016x}>"
 
 
+def _encode_parameters(
+    parameters: Optional[_Parameters[Any]],
+) -> list[encoders._Encoded]:
+    if parameters is None:
+        return []
+    if isinstance(parameters, Mapping):
+        raise exc.ProgrammingError("parameters must be a sequence for 'qmark' style")
+    encode = encoders.encode
+    return [encode(parameters[i]) for i in range(len(parameters))]
+
+
 # Type Objects and Constructors
 # https://peps.python.org/pep-0249/#type-objects-and-constructors
 class TypeConstants(tuple[int], enum.Enum):
@@ -315,12 +595,16 @@ DATETIME = _DbApiColumnType(TypeConstants.DATETIME)
 ROWID = _DbApiColumnType(TypeConstants.ROWID)
 
 
-def Date(year: SupportsIndex, month: SupportsIndex, day: SupportsIndex) -> Any:
-    raise NotImplementedError
+def Date(
+    year: SupportsIndex, month: SupportsIndex, day: SupportsIndex
+) -> datetime.date:
+    return datetime.date(year, month, day)
 
 
-def Time(hour: SupportsIndex, minute: SupportsIndex, second: SupportsIndex) -> Any:
-    raise NotImplementedError
+def Time(
+    hour: SupportsIndex, minute: SupportsIndex, second: SupportsIndex
+) -> datetime.time:
+    return datetime.time(hour, minute, second)
 
 
 def Timestamp(
@@ -330,17 +614,21 @@ def Timestamp(
     hour: SupportsIndex,
     minute: SupportsIndex,
     second: SupportsIndex,
-) -> Any:
-    raise NotImplementedError
+) -> datetime.datetime:
+    return datetime.datetime(year, month, day, hour, minute, second)
+
+
+def DateFromTicks(ticks: float) -> datetime.date:
+    return Date(*time.localtime(ticks)[:3])
 
 
-def DateFromTicks(ticks: float) -> Date:
-    raise NotImplementedError
+def TimeFromTicks(ticks: float) -> datetime.time:
+    return Time(*time.localtime(ticks)[3:6])
 
 
-def TimeFromTicks(ticks: float) -> Time:
-    raise NotImplementedError
+def TimestampFromTicks(ticks: float) -> datetime.datetime:
+    return Timestamp(*time.localtime(ticks)[:6])
 
 
-def TimestampFromTicks(ticks: float) -> Timestamp:
-    raise NotImplementedError
+def Binary(string: Union[bytes, bytearray, memoryview]) -> bytes:
+    return bytes(string)
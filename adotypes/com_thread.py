@@ -0,0 +1,407 @@
+from collections import deque
+from collections.abc import Callable, Iterable, MutableMapping
+from concurrent.futures import Future
+import logging
+import queue
+import sys
+import threading
+import types
+from typing import Any, Optional, TypeVar, Union
+import weakref
+
+import comtypes
+
+from adotypes import tracing, api_exceptions as exc
+from adotypes._hints import (
+    _Parameters,
+    _ColumnDescription,
+    _InputSizes,
+    _OutputSize,
+    _RowFactory,
+)
+from adotypes.api_objects import Connection, Cursor
+
+LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+_Request = tuple["Future[Any]", Callable[..., Any], tuple[Any, ...], dict[str, Any]]
+
+
+class ComThread:
+    """A dedicated worker thread that lives in its own single-threaded COM
+    apartment.
+
+    Every COM object must be used from the apartment it was created in, so all
+    calls that touch ADO objects are queued and run one by one on this thread.
+    """
+
+    def __init__(self, name: Optional[str] = None) -> None:
+        self._queue: "queue.SimpleQueue[Optional[_Request]]" = queue.SimpleQueue()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        comtypes.CoInitializeEx(comtypes.COINIT_APARTMENTTHREADED)
+        try:
+            while (req := self._queue.get()) is not None:
+                fut, fn, args, kwargs = req
+                # drop the reference to the request as soon as possible so
+                # that COM objects bound to it are released on this thread.
+                del req
+                if fut.set_running_or_notify_cancel():
+                    try:
+                        fut.set_result(fn(*args, **kwargs))
+                    except BaseException as e:
+                        fut.set_exception(e)
+                del fut, fn, args, kwargs
+        finally:
+            comtypes.CoUninitialize()
+        LOGGER.debug("%r has been stopped", self)
+
+    def submit(self, fn: Callable[..., _T], *args: Any, **kwargs: Any) -> "Future[_T]":
+        """Queues `fn(*args, **kwargs)` and returns a future without waiting.
+
+        Requests are run in the order they were submitted, so several requests
+        can be pipelined without waiting for each result.
+        """
+        if self._stopped:
+            raise exc.InterfaceError(f"{self!r} has been stopped")
+        fut: "Future[_T]" = Future()
+        self._queue.put((fut, fn, args, kwargs))
+        return fut
+
+    def call(self, fn: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+        """Runs `fn(*args, **kwargs)` on the worker thread and waits for it."""
+        if sys.is_finalizing():
+            # daemon threads are frozen while the interpreter shuts down, so
+            # waiting for them would never end.
+            raise exc.InterfaceError(f"{self!r} cannot run during shutdown")
+        if self.is_current():
+            return fn(*args, **kwargs)
+        return self.submit(fn, *args, **kwargs).result()
+
+    def stop(self, wait: bool = True) -> None:
+        if self._stopped:
+            return
+        self._stopped = True
+        self._queue.put(None)
+        if wait and not self.is_current():
+            self._thread.join()
+
+    def is_current(self) -> bool:
+        return threading.current_thread() is self._thread
+
+    def __repr__(self) -> str:
+        return f"<ComThread object at {id(self):#016x}>"
+
+
+class _BlockPrefetcher:
+    """Buffers the rows of a `Cursor` living on a `ComThread`.
+
+    Rows are fetched in blocks of `blocksize`. Once a block has been taken in,
+    the next one is queued on the worker thread, so it is being fetched while
+    the caller consumes the current one. Waiting for a block is left to the
+    caller; a block stays pending until `accept` is called, so a wait that is
+    interrupted does not lose it.
+    """
+
+    def __init__(self, worker: ComThread, cursor: Cursor, blocksize: int) -> None:
+        self.blocksize = blocksize
+        self.rows: deque[Any] = deque()
+        self._worker = worker
+        self._cursor = cursor
+        self._pending: Optional["Future[list[Any]]"] = None
+        self._exhausted = True
+
+    def start(self) -> None:
+        """Discards the buffered rows of the previous result set."""
+        self.reset()
+        self._exhausted = False
+
+    def next_block(self) -> Optional["Future[list[Any]]"]:
+        """Returns the future of the next block, or None if no rows are left."""
+        if self._pending is None and not self._exhausted:
+            self._pending = self._prefetch()
+        return self._pending
+
+    def remaining(self) -> Optional["Future[list[Any]]"]:
+        """Returns the future of the rows that have not been buffered yet, or
+        None if no rows are left."""
+        if self._pending is None and not self._exhausted:
+            # a single request on the worker thread is cheaper than
+            # a round trip per block.
+            self._pending = self._worker.submit(self._cursor.fetchall)
+            self._exhausted = True
+        return self._pending
+
+    def accept(self, prefetch: bool = True) -> bool:
+        """Buffers the pending block, which must be done, and queues the next
+        one if `prefetch` is true and the block was full."""
+        assert self._pending is not None and self._pending.done()
+        try:
+            block = self._pending.result()
+        finally:
+            self._pending = None
+        if len(block) < self.blocksize:
+            self._exhausted = True
+        elif prefetch and not self._exhausted:
+            self._pending = self._prefetch()
+        self.rows.extend(block)
+        return bool(block)
+
+    def _prefetch(self) -> "Future[list[Any]]":
+        return self._worker.submit(self._cursor.fetchmany, self.blocksize)
+
+    def take(self, size: Optional[int] = None) -> list[Any]:
+        """Removes up to `size` buffered rows, or all of them if `size` is None."""
+        if size is None or size >= len(self.rows):
+            result = list(self.rows)
+            self.rows.clear()
+            return result
+        return [self.rows.popleft() for _ in range(size)]
+
+    def reset(self) -> None:
+        if self._pending is not None:
+            # requests run in order, so a block that is already being fetched
+            # is finished before anything submitted after it.
+            self._pending.cancel()
+            self._pending = None
+        self.rows.clear()
+        self._exhausted = True
+
+    def release(self) -> None:
+        self.reset()
+        del self._cursor
+
+
+class ThreadedConnection:
+    """A `Connection` that owns a dedicated `ComThread`.
+
+    The wrapped `Connection` and its cursors are created and used only on the
+    worker thread, so an instance of this class can be shared across threads.
+    """
+
+    blocksize: int
+
+    def __init__(self, factory: Callable[[], Connection], blocksize: int = 100) -> None:
+        self.blocksize = blocksize
+        self._worker = ComThread()
+        try:
+            self._connection = self._worker.call(factory)
+        except BaseException:
+            self._worker.stop()
+            raise
+        # reentrant: a collection during `register_cursor` can finalize
+        # another cursor, whose `close` calls `unregister_cursor`.
+        self._lock = threading.RLock()
+        self._cursors: MutableMapping[
+            int, "ThreadedCursor"
+        ] = weakref.WeakValueDictionary()
+
+    def close(self) -> None:
+        if not hasattr(self, "_connection"):
+            LOGGER.debug("%r has been closed", self)
+            return
+        with self._lock:
+            cursors = list(self._cursors.values())
+        for c in cursors:
+            c.close()
+        del cursors
+        self._worker.call(self._release)
+        self._worker.stop()
+        LOGGER.debug("complete closing %r", self)
+
+    def _release(self) -> None:
+        # runs on the worker thread, so the COM objects owned by the wrapped
+        # connection are released in the apartment they were created in.
+        self._connection.close()
+        del self._connection
+
+    def commit(self) -> None:
+        self._worker.call(self._connection.commit)
+
+    def rollback(self) -> None:
+        self._worker.call(self._connection.rollback)
+
+    def cursor(self) -> "ThreadedCursor":
+        return ThreadedCursor(self, self._worker.call(self._connection.cursor))
+
+    def run(self, fn: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+        """Runs `fn(connection, *args, **kwargs)` on the worker thread.
+
+        This is the way to reach the ADO objects, such as
+        `Connection.ado_connection` and `Connection.adox_catalog`, that cannot
+        be used outside of the apartment they were created in.
+        """
+        return self._worker.call(fn, self._connection, *args, **kwargs)
+
+    @property
+    def stats(self) -> tracing.Stats:
+        return self._worker.call(getattr, self._connection, "stats")
+
+    @property
+    def row_factory(self) -> Optional[_RowFactory]:
+        return self._connection.row_factory
+
+    @row_factory.setter
+    def row_factory(self, factory: Optional[_RowFactory]) -> None:
+        self._connection.row_factory = factory
+
+    def __del__(self) -> None:
+        if not sys.is_finalizing():
+            self.close()
+
+    def __enter__(self) -> "ThreadedConnection":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[Exception]],
+        exc_val: Optional[Exception],
+        exc_tb: Optional[types.TracebackType],
+    ) -> None:
+        if exc_type:
+            self.rollback()
+        else:
+            self.commit()
+
+    def register_cursor(self, cursor: "ThreadedCursor") -> None:
+        with self._lock:
+            self._cursors[hash(cursor)] = cursor
+        LOGGER.debug("%r is registered", cursor)
+
+    def unregister_cursor(self, cursor: "ThreadedCursor") -> None:
+        with self._lock:
+            del self._cursors[hash(cursor)]
+        LOGGER.debug("%r is unregistered", cursor)
+
+    def __repr__(self) -> str:
+        return f"<ThreadedConnection object at {id(self):#016x}>"
+
+
+class ThreadedCursor:
+    """A `Cursor` whose calls are marshalled to the worker thread of its
+    `ThreadedConnection`.
+
+    Rows are fetched in blocks of `blocksize`. While the caller consumes a
+    block, the next one is already being fetched on the worker thread.
+    """
+
+    arraysize: int
+
+    def __init__(self, connection: ThreadedConnection, cursor: Cursor) -> None:
+        self.arraysize = 1
+        self._connection = connection
+        self._cursor = cursor
+        self._worker = connection._worker
+        self._blocks = _BlockPrefetcher(self._worker, cursor, connection.blocksize)
+        self._connection.register_cursor(self)
+
+    @property
+    def blocksize(self) -> int:
+        return self._blocks.blocksize
+
+    @blocksize.setter
+    def blocksize(self, size: int) -> None:
+        self._blocks.blocksize = size
+
+    @property
+    def row_factory(self) -> Optional[_RowFactory]:
+        return self._cursor.row_factory
+
+    @row_factory.setter
+    def row_factory(self, factory: Optional[_RowFactory]) -> None:
+        # plain attributes of the wrapped cursor may be set from any thread
+        self._cursor.row_factory = factory
+
+    @property
+    def description(self) -> Optional[list[_ColumnDescription]]:
+        return self._worker.call(getattr, self._cursor, "description")
+
+    @property
+    def rowcount(self) -> int:
+        return self._worker.call(getattr, self._cursor, "rowcount")
+
+    def close(self) -> None:
+        if not hasattr(self, "_connection"):
+            LOGGER.debug("%r has been closed", self)
+            return
+        self._worker.call(self._release)
+        self._connection.unregister_cursor(self)
+        del self._connection
+        LOGGER.debug("complete closing %r", self)
+
+    def _release(self) -> None:
+        self._blocks.release()
+        self._cursor.close()
+        del self._cursor
+
+    def execute(
+        self, operation: str, parameters: Optional[_Parameters[Any]] = None
+    ) -> None:
+        self._blocks.reset()
+        self._worker.call(self._cursor.execute, operation, parameters)
+        self._blocks.start()
+
+    def executemany(
+        self, operation: str, seq_of_parameters: Iterable[_Parameters[Any]]
+    ) -> None:
+        self._blocks.reset()
+        self._worker.call(self._cursor.executemany, operation, seq_of_parameters)
+        self._blocks.start()
+
+    def fetchone(self) -> Optional[Any]:
+        if not self._blocks.rows and not self._fill():
+            return None
+        return self._blocks.rows.popleft()
+
+    def fetchmany(self, size: Optional[int] = None) -> list[Any]:
+        size = self.arraysize if size is None else size
+        while len(self._blocks.rows) < size and self._fill():
+            pass
+        return self._blocks.take(size)
+
+    def fetchall(self) -> list[Any]:
+        while (fut := self._blocks.remaining()) is not None:
+            fut.result()
+            self._blocks.accept(prefetch=False)
+        return self._blocks.take()
+
+    def _fill(self) -> bool:
+        """Waits for the next block and queues the one after it."""
+        if (fut := self._blocks.next_block()) is None:
+            return False
+        fut.result()
+        return self._blocks.accept()
+
+    def setinputsizes(self, sizes: _InputSizes) -> None:
+        self._worker.call(self._cursor.setinputsizes, sizes)
+
+    def setoutputsize(
+        self, size: _OutputSize, column: Union[None, int, str] = None
+    ) -> None:
+        self._worker.call(self._cursor.setoutputsize, size, column)
+
+    def __del__(self) -> None:
+        if not sys.is_finalizing():
+            self.close()
+
+    def __enter__(self) -> "ThreadedCursor":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[Exception]],
+        exc_val: Optional[Exception],
+        exc_tb: Optional[types.TracebackType],
+    ) -> None:
+        self.close()
+
+    @property
+    def connection(self) -> ThreadedConnection:
+        return self._connection
+
+    def __repr__(self) -> str:
+        return f"<ThreadedCursor object at {id(self):#016x}>"
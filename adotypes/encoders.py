@@ -0,0 +1,202 @@
+"""Encoders converting Python values into ADO parameters.
+
+An encoder takes a value and returns `(type, size, value)`, where `type` is an
+ADO `DataTypeEnum` member, `size` is the `Size` of the parameter and `value`
+is what is assigned to its `Value`, either a Python object that `comtypes`
+converts by itself or a prepared `VARIANT`.
+
+Encoders are looked up by the exact type of the value. Subclasses of a
+registered type are resolved through the MRO once and then cached, so binding
+many rows does not inspect each value more than a dictionary lookup.
+"""
+import array
+from collections.abc import Callable
+import ctypes
+import datetime
+import decimal
+from typing import Any
+
+from comtypes.automation import VARIANT, VT_ARRAY, VT_CY, VT_DATE, VT_DECIMAL, VT_UI1
+from comtypes.safearray import _midlSAFEARRAY
+
+from adotypes import com_dlls, api_exceptions as exc
+
+_Encoded = tuple[int, int, Any]
+_Encoder = Callable[[Any], _Encoded]
+
+_SECONDS_PER_DAY = 86400
+_OLE_EPOCH = datetime.datetime(1899, 12, 30)
+_OLE_EPOCH_ORDINAL = _OLE_EPOCH.toordinal()
+
+# the largest string sent as `adVarWChar`; longer ones are `adLongVarWChar`
+_MAX_VARWCHAR = 4000
+
+_CY_MIN = -(2**63)
+_CY_MAX = 2**63 - 1
+
+# DECIMAL is a 96 bit unsigned integer, a sign and a power of ten from 0 to 28
+_DEC_MAX = 2**96 - 1
+_DEC_MAX_SCALE = 28
+
+
+def ole_date(days: int, seconds: float) -> float:
+    """Returns the OLE Automation date of `days` since 1899-12-30 plus
+    `seconds` since midnight.
+
+    The fraction of an OLE Automation date is the time of the day regardless
+    of the sign, e.g. -1.25 is 1899-12-29 06:00.
+    """
+    fraction = seconds / _SECONDS_PER_DAY
+    return days - fraction if days < 0 else days + fraction
+
+
+def _variant(vt: int, field: str, value: Any) -> VARIANT:
+    v = VARIANT()
+    setattr(v._, field, value)
+    v.vt = vt
+    return v
+
+
+def _encode_none(value: None) -> _Encoded:
+    return (com_dlls.adodb.adVarWChar, 1, None)
+
+
+def _encode_bool(value: bool) -> _Encoded:
+    return (com_dlls.adodb.adBoolean, 0, value)
+
+
+def _encode_int(value: int) -> _Encoded:
+    if -(2**31) <= value < 2**31:
+        return (com_dlls.adodb.adInteger, 0, value)
+    return (com_dlls.adodb.adBigInt, 0, value)
+
+
+def _encode_float(value: float) -> _Encoded:
+    return (com_dlls.adodb.adDouble, 0, value)
+
+
+def _encode_str(value: str) -> _Encoded:
+    # `Size` counts UTF-16 code units, so characters beyond the BMP count twice
+    size = len(value) if value.isascii() else len(value.encode("utf-16-le")) // 2
+    if size > _MAX_VARWCHAR:
+        return (com_dlls.adodb.adLongVarWChar, size, value)
+    return (com_dlls.adodb.adVarWChar, max(size, 1), value)
+
+
+def _encode_decimal(value: decimal.Decimal) -> _Encoded:
+    if not value.is_finite():
+        raise exc.DataError(f"cannot bind {value}")
+    if value and value.adjusted() > _DEC_MAX_SCALE:
+        raise exc.DataError(f"{value} is out of the range of DECIMAL")
+    sign, digits, exponent = value.as_tuple()
+    assert isinstance(exponent, int)
+    mantissa = int("".join(map(str, digits)))
+    scale = -exponent
+    if scale < 0:
+        mantissa *= 10**-scale
+        scale = 0
+    # CURRENCY is a 64 bit integer scaled by 10000
+    if scale <= 4:
+        scaled = mantissa * 10 ** (4 - scale)
+        scaled = -scaled if sign else scaled
+        if _CY_MIN <= scaled <= _CY_MAX:
+            return (com_dlls.adodb.adCurrency, 0, _variant(VT_CY, "VT_CY", scaled))
+    while scale > _DEC_MAX_SCALE and mantissa % 10 == 0:
+        mantissa //= 10
+        scale -= 1
+    if scale > _DEC_MAX_SCALE or mantissa > _DEC_MAX:
+        raise exc.DataError(f"{value} cannot be represented as DECIMAL")
+    v = VARIANT()
+    # `decVal` overlaps `vt`, so `vt` is set last
+    v.decVal.scale = scale
+    v.decVal.sign = 0x80 if sign else 0
+    v.decVal.Hi32 = mantissa >> 64
+    v.decVal.Lo64 = mantissa & 0xFFFFFFFFFFFFFFFF
+    v.vt = VT_DECIMAL
+    return (com_dlls.adodb.adDecimal, 0, v)
+
+
+def decimal_digits(value: VARIANT) -> tuple[int, int]:
+    """Returns the `Precision` and `NumericScale` of a parameter bound to the
+    VT_DECIMAL `value`."""
+    mantissa = value.decVal.Hi32 << 64 | value.decVal.Lo64
+    scale = value.decVal.scale
+    return (max(len(str(mantissa)), scale, 1), scale)
+
+
+def _encode_datetime(value: datetime.datetime) -> _Encoded:
+    days = value.toordinal() - _OLE_EPOCH_ORDINAL
+    seconds = value.hour * 3600 + value.minute * 60 + value.second
+    date = ole_date(days, seconds + value.microsecond / 1e6)
+    return (com_dlls.adodb.adDate, 0, _variant(VT_DATE, "VT_DATE", date))
+
+
+def _encode_date(value: datetime.date) -> _Encoded:
+    date = float(value.toordinal() - _OLE_EPOCH_ORDINAL)
+    return (com_dlls.adodb.adDate, 0, _variant(VT_DATE, "VT_DATE", date))
+
+
+def _encode_time(value: datetime.time) -> _Encoded:
+    seconds = value.hour * 3600 + value.minute * 60 + value.second
+    date = ole_date(0, seconds + value.microsecond / 1e6)
+    return (com_dlls.adodb.adDate, 0, _variant(VT_DATE, "VT_DATE", date))
+
+
+def _encode_binary(value: Any) -> _Encoded:
+    # `comtypes` converts `array.array("B")` to a SAFEARRAY of VT_UI1
+    data = array.array("B")
+    data.frombytes(value)
+    if not data:
+        return (com_dlls.adodb.adLongVarBinary, 1, _empty_binary())
+    return (com_dlls.adodb.adLongVarBinary, len(data), VARIANT(data))
+
+
+def _empty_binary() -> VARIANT:
+    # `VARIANT` turns an empty sequence into VT_NULL, so the empty SAFEARRAY
+    # is made the same way `VARIANT` makes one from a non-empty array.
+    sa = _midlSAFEARRAY(ctypes.c_ubyte).create(array.array("B"))
+    v = VARIANT()
+    ctypes.memmove(ctypes.byref(v._), ctypes.byref(sa), ctypes.sizeof(sa))
+    v.vt = VT_ARRAY | VT_UI1
+    return v
+
+
+_REGISTERED: dict[type, _Encoder] = {
+    type(None): _encode_none,
+    bool: _encode_bool,
+    int: _encode_int,
+    float: _encode_float,
+    str: _encode_str,
+    decimal.Decimal: _encode_decimal,
+    datetime.datetime: _encode_datetime,
+    datetime.date: _encode_date,
+    datetime.time: _encode_time,
+    bytes: _encode_binary,
+    bytearray: _encode_binary,
+    memoryview: _encode_binary,
+}
+
+# the encoder of each type seen so far, resolved through the MRO
+_CACHE: dict[type, _Encoder] = {}
+
+
+def register(tp: type, encoder: _Encoder) -> None:
+    """Registers `encoder` for values of `tp` and its subclasses."""
+    _REGISTERED[tp] = encoder
+    _CACHE.clear()
+
+
+def get_encoder(tp: type) -> _Encoder:
+    try:
+        return _CACHE[tp]
+    except KeyError:
+        pass
+    for base in tp.__mro__:
+        if base in _REGISTERED:
+            encoder = _CACHE[tp] = _REGISTERED[base]
+            return encoder
+    raise exc.NotSupportedError(f"cannot bind a value of {tp.__name__!r}")
+
+
+def encode(value: Any) -> _Encoded:
+    return get_encoder(type(value))(value)
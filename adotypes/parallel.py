@@ -0,0 +1,163 @@
+from collections.abc import Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    InvalidStateError,
+    ProcessPoolExecutor,
+    as_completed,
+    wait,
+)
+import atexit
+import decimal
+import logging
+import math
+from typing import Any, Optional, Union
+
+from adotypes import api_exceptions as exc
+from adotypes.api_constructors import connect
+from adotypes.api_objects import Connection
+
+LOGGER = logging.getLogger(__name__)
+
+_Bound = Union[int, float, decimal.Decimal]
+
+# the connection opened by `_init_worker` in each worker process
+_CONNECTION: Optional[Connection] = None
+
+
+def extract(
+    conn_str: str,
+    query: str,
+    partition_column: str,
+    partitions: int = 4,
+    workers: Optional[int] = None,
+    *,
+    ordered: bool = True,
+    bounds: Optional[tuple[_Bound, _Bound]] = None,
+) -> Iterator[tuple[Any, ...]]:
+    """Runs a SELECT `query` split into `partitions` key ranges of the numeric
+    `partition_column` across a pool of `workers` processes.
+
+    Each worker process opens its own connection with `connect(open=conn_str)`
+    and fetches whole partitions. Rows are yielded partition by partition, in
+    key order if `ordered` is true or as soon as each partition is complete
+    otherwise. Rows whose `partition_column` is NULL belong to the first
+    partition.
+
+    `bounds` is the `(min, max)` of `partition_column`; if omitted, it is
+    queried before the partitions are dispatched. If every key is NULL, the
+    query runs as a single partition.
+
+    As soon as a partition fails, the partitions that have not started yet are
+    cancelled and the error is raised, even if partitions before it are still
+    running.
+    """
+    if partitions < 1:
+        raise exc.ProgrammingError(f"partitions must be positive: {partitions!r}")
+    if bounds is None:
+        bounds = _query_bounds(conn_str, query, partition_column)
+    if bounds is None:
+        # no key is set, but the rows whose key is NULL are still there
+        preds = ["1 = 1"]
+    else:
+        preds = _predicates(partition_column, *bounds, partitions)
+    statements = [f"SELECT * FROM ({query}) AS q WHERE {pred}" for pred in preds]
+    executor = ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(conn_str,)
+    )
+    try:
+        futures = [executor.submit(_extract, stmt) for stmt in statements]
+        failure = _first_failure(futures)
+        completed: Iterator["Future[list[tuple[Any, ...]]]"] = (
+            iter(futures) if ordered else as_completed(futures)
+        )
+        for fut in completed:
+            if not fut.done():
+                wait((fut, failure), return_when=FIRST_COMPLETED)
+            if failure.done():
+                failure.result()
+            yield from fut.result()
+    except BaseException:
+        # also reached when the consumer stops iterating (`GeneratorExit`).
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    executor.shutdown()
+
+
+def _first_failure(futures: list["Future[Any]"]) -> "Future[None]":
+    """Returns a future that fails with the error of the first of `futures`
+    to fail, at which point the others are cancelled."""
+    failure: "Future[None]" = Future()
+
+    def on_done(fut: "Future[Any]") -> None:
+        if fut.cancelled() or (e := fut.exception()) is None:
+            return
+        try:
+            failure.set_exception(e)
+        except InvalidStateError:
+            return  # another partition has failed first
+        for f in futures:
+            f.cancel()
+
+    for fut in futures:
+        fut.add_done_callback(on_done)
+    return failure
+
+
+def _query_bounds(
+    conn_str: str, query: str, column: str
+) -> Optional[tuple[_Bound, _Bound]]:
+    conn = connect(open=conn_str)
+    try:
+        c = conn.cursor()
+        c.execute(f"SELECT MIN({column}), MAX({column}) FROM ({query}) AS q")
+        result = c.fetchone()
+    finally:
+        conn.close()
+    if result is None or result[0] is None:
+        return None
+    lo, hi = result
+    return (lo, hi)
+
+
+def _predicates(column: str, lo: _Bound, hi: _Bound, partitions: int) -> list[str]:
+    # fail before dispatching anything if the bounds cannot be rendered
+    _literal(lo)
+    _literal(hi)
+    if partitions == 1:
+        return ["1 = 1"]
+    if isinstance(lo, int) and isinstance(hi, int):
+        step: _Bound = max(math.ceil((hi - lo + 1) / partitions), 1)
+    else:
+        step = (hi - lo) / partitions
+    cuts = [_literal(lo + step * i) for i in range(1, partitions)]
+    preds = [f"({column} < {cuts[0]} OR {column} IS NULL)"]
+    preds.extend(
+        f"({column} >= {a} AND {column} < {b})" for a, b in zip(cuts, cuts[1:])
+    )
+    preds.append(f"{column} >= {cuts[-1]}")
+    return preds
+
+
+def _literal(value: _Bound) -> str:
+    if isinstance(value, decimal.Decimal):
+        # `MIN` and `MAX` of CURRENCY and DECIMAL columns are `Decimal`
+        return str(value)
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise exc.NotSupportedError(
+            f"partition bounds must be numbers, not {type(value).__name__}"
+        )
+    return repr(value)
+
+
+def _init_worker(conn_str: str) -> None:
+    global _CONNECTION
+    _CONNECTION = connect(open=conn_str)
+    atexit.register(_CONNECTION.close)
+
+
+def _extract(statement: str) -> list[tuple[Any, ...]]:
+    assert _CONNECTION is not None
+    with _CONNECTION.cursor() as c:
+        c.execute(statement)
+        return c.fetchall()
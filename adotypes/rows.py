@@ -0,0 +1,89 @@
+"""Built-in row factories for `Connection.row_factory` and
+`Cursor.row_factory`.
+
+A row factory is called once per result set with its description and returns
+the callable that builds each row from the values of its columns. The classes
+below are generated once per distinct list of column names and cached.
+"""
+from collections import namedtuple
+from collections.abc import Callable, Iterable, Iterator
+import functools
+from typing import Any, Union
+
+from adotypes._hints import _ColumnDescription
+
+
+def namedtuple_row(
+    description: list[_ColumnDescription],
+) -> Callable[[Iterable[Any]], tuple[Any, ...]]:
+    """Builds rows as named tuples. Invalid or duplicate column names are
+    replaced with positional names such as `_1`."""
+    return _namedtuple_class(_names(description))._make
+
+
+def slotted_row(
+    description: list[_ColumnDescription],
+) -> Callable[[Iterable[Any]], "Row"]:
+    """Builds rows as `Row`s, accessible by index, by column name and, where
+    the column name is a valid attribute name, by attribute."""
+    return _row_class(_names(description))
+
+
+def _names(description: list[_ColumnDescription]) -> tuple[str, ...]:
+    return tuple(d[0] or "" for d in description)
+
+
+@functools.lru_cache(maxsize=128)
+def _namedtuple_class(names: tuple[str, ...]) -> type[tuple[Any, ...]]:
+    return namedtuple("Row", names, rename=True)  # type: ignore
+
+
+class Row:
+    """A row holding only its values; the column names and their index are
+    shared by all the rows of the generated subclass."""
+
+    __slots__ = ("_values",)
+
+    _fields: tuple[str, ...] = ()
+    _index: dict[str, int] = {}
+
+    def __init__(self, values: Iterable[Any]) -> None:
+        self._values = tuple(values)
+
+    def __getitem__(self, key: Union[int, slice, str]) -> Any:
+        if isinstance(key, str):
+            return self._values[self._index[key]]
+        return self._values[key]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._values)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Row):
+            return self._values == other._values
+        return self._values == other
+
+    def __hash__(self) -> int:
+        return hash(self._values)
+
+    def keys(self) -> tuple[str, ...]:
+        return self._fields
+
+    def __repr__(self) -> str:
+        items = ", ".join(f"{n}={v!r}" for n, v in zip(self._fields, self._values))
+        return f"Row({items})"
+
+
+@functools.lru_cache(maxsize=128)
+def _row_class(names: tuple[str, ...]) -> type[Row]:
+    index: dict[str, int] = {}
+    for i, n in enumerate(names):
+        index.setdefault(n, i)
+    ns: dict[str, Any] = {"__slots__": (), "_fields": names, "_index": index}
+    for n, i in index.items():
+        if n.isidentifier() and not n.startswith("_") and not hasattr(Row, n):
+            ns[n] = property(lambda self, i=i: self._values[i])
+    return type("Row", (Row,), ns)
@@ -0,0 +1,113 @@
+import bisect
+import functools
+import re
+from typing import TYPE_CHECKING, NamedTuple, Optional
+
+if TYPE_CHECKING:
+    from adotypes.api_objects import Connection
+
+# upper bounds, in seconds, of the buckets of the latency histograms.
+# the last bucket of a histogram counts everything slower than `1.0`.
+LATENCY_BUCKETS = (0.0001, 0.001, 0.01, 0.1, 1.0)
+
+_HOOKS: list["Hook"] = []
+
+
+class TraceEvent(NamedTuple):
+    kind: str  # "connect", "execute", "fetch", "commit" or "rollback"
+    connection: Optional["Connection"]  # `None` before connecting
+    fingerprint: Optional[str]  # the normalized statement of "execute"
+    elapsed: Optional[float]  # seconds; `None` in `Hook.before`
+    rows: Optional[int]  # rows fetched by "fetch"
+    # COM calls made by the operation; 0 in `Hook.before` and for a failed
+    # "connect"
+    com_calls: int
+    error: Optional[BaseException] = None
+
+
+class Hook:
+    """Base class of instrumentation hooks.
+
+    Hooks are called on the thread that runs the operation, which is the
+    worker thread for threaded and asyncio connections.
+    """
+
+    def before(self, event: TraceEvent) -> None:
+        pass
+
+    def after(self, event: TraceEvent) -> None:
+        pass
+
+
+def register(hook: Hook) -> None:
+    _HOOKS.append(hook)
+
+
+def unregister(hook: Hook) -> None:
+    _HOOKS.remove(hook)
+
+
+_LITERALS = re.compile(r"'(?:[^']|'')*'|#[^#]*#|\b\d+(?:\.\d*)?(?:[eE][-+]?\d+)?\b")
+_SPACES = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=256)
+def fingerprint(statement: str) -> str:
+    """Replaces literals of `statement` with `?` and collapses whitespace, so
+    statements that differ only in their values share a fingerprint."""
+    return _SPACES.sub(" ", _LITERALS.sub("?", statement)).strip()
+
+
+def _before(
+    kind: str, connection: Optional["Connection"], statement: Optional[str] = None
+) -> None:
+    fp = None if statement is None else fingerprint(statement)
+    event = TraceEvent(kind, connection, fp, None, None, 0)
+    for hook in _HOOKS:
+        hook.before(event)
+
+
+def _after(
+    kind: str,
+    connection: Optional["Connection"],
+    statement: Optional[str],
+    elapsed: float,
+    rows: Optional[int],
+    com_calls: int,
+    error: Optional[BaseException] = None,
+) -> None:
+    fp = None if statement is None else fingerprint(statement)
+    event = TraceEvent(kind, connection, fp, elapsed, rows, com_calls, error)
+    for hook in _HOOKS:
+        hook.after(event)
+
+
+class Stats(NamedTuple):
+    statements: dict[str, int]  # kind -> number of operations
+    latency: dict[str, tuple[int, ...]]  # kind -> histogram of `LATENCY_BUCKETS`
+    rows_fetched: int
+    com_calls: int
+
+
+class _Statistics:
+    def __init__(self) -> None:
+        self._latency: dict[str, list[int]] = {}
+        self._rows_fetched = 0
+        self._com_calls = 0
+
+    def record(self, kind: str, elapsed: float, com_calls: int, rows: int = 0) -> None:
+        try:
+            histogram = self._latency[kind]
+        except KeyError:
+            histogram = self._latency[kind] = [0] * (len(LATENCY_BUCKETS) + 1)
+        histogram[bisect.bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+        self._rows_fetched += rows
+        self._com_calls += com_calls
+
+    def snapshot(self) -> Stats:
+        return Stats(
+            {k: sum(v) for k, v in self._latency.items()},
+            {k: tuple(v) for k, v in self._latency.items()},
+            self._rows_fetched,
+            self._com_calls,
+        )
@@ -0,0 +1,47 @@
+"""Compares two JSON files written by `benchmarks.run`.
+
+Exits with status 1 if any benchmark is slower than the baseline by more than
+`--threshold`, or makes more COM calls than the baseline.
+"""
+import argparse
+import json
+import sys
+from typing import Any
+
+
+def main(argv: Any = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="allowed relative slowdown"
+    )
+    args = parser.parse_args(argv)
+    with open(args.baseline) as f:
+        baseline = json.load(f)["results"]
+    with open(args.current) as f:
+        current = json.load(f)["results"]
+    regressed = False
+    print(f"{'benchmark':<36} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, cur in current.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:<36} {'-':>12} {cur['median'] * 1e6:10.1f}us {'new':>8}")
+            continue
+        change = cur["median"] / base["median"] - 1
+        mark = ""
+        if change > args.threshold:
+            mark = "  slower"
+            regressed = True
+        if cur["com_calls"] > base["com_calls"]:
+            mark += f"  com calls {base['com_calls']} -> {cur['com_calls']}"
+            regressed = True
+        print(
+            f"{name:<36} {base['median'] * 1e6:10.1f}us {cur['median'] * 1e6:10.1f}us"
+            f" {change:+8.1%}{mark}"
+        )
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
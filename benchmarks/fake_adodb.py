@@ -0,0 +1,415 @@
+"""A pure-Python stand-in for the ADODB/ADOX surface used by `adotypes`.
+
+`install()` must be called before `adotypes` is imported. It replaces
+`adotypes.com_dlls` with fake `adodb`/`adox` namespaces and, when `comtypes`
+is not importable (e.g. on Linux), registers a minimal fake `comtypes` too.
+
+Every property access and method call on a fake COM object spins for
+`LATENCY` seconds to simulate the cost of crossing the COM boundary.
+"""
+import re
+import sys
+import time
+import types
+from typing import Any, Optional
+
+LATENCY = 0.0
+CALLS = 0
+
+# name -> (column names, column type codes, rows)
+TABLES: dict[str, tuple[list[str], list[int], list[tuple[Any, ...]]]] = {}
+
+_FROM = re.compile(r"\bFROM\s+(\w+)", re.IGNORECASE)
+
+
+def _com_call() -> None:
+    global CALLS
+    CALLS += 1
+    if LATENCY:
+        deadline = time.perf_counter() + LATENCY
+        while time.perf_counter() < deadline:
+            pass
+
+
+class _ComObject:
+    def QueryInterface(self, interface: Any) -> Any:
+        _com_call()
+        return self
+
+
+class _Field(_ComObject):
+    def __init__(self, rs: "_Recordset", index: int) -> None:
+        self._rs = rs
+        self._index = index
+
+    @property
+    def Value(self) -> Any:
+        _com_call()
+        return self._rs._rows[self._rs._pos][self._index]
+
+    @property
+    def Name(self) -> str:
+        _com_call()
+        return self._rs._names[self._index]
+
+    @property
+    def Type(self) -> int:
+        _com_call()
+        return self._rs._types[self._index]
+
+    @property
+    def DefinedSize(self) -> int:
+        _com_call()
+        return 4 if self._rs._types[self._index] == adInteger else 255
+
+    @property
+    def ActualSize(self) -> int:
+        _com_call()
+        return self.DefinedSize
+
+    @property
+    def Precision(self) -> int:
+        _com_call()
+        return 10 if self._rs._types[self._index] == adInteger else 255
+
+    @property
+    def NumericScale(self) -> int:
+        _com_call()
+        return 255
+
+    @property
+    def Attributes(self) -> int:
+        _com_call()
+        return adFldIsNullable | adFldMayBeNull
+
+
+class _Fields(_ComObject):
+    def __init__(self, rs: "_Recordset") -> None:
+        self._items = [_Field(rs, i) for i in range(len(rs._names))]
+
+    @property
+    def Count(self) -> int:
+        _com_call()
+        return len(self._items)
+
+    def Item(self, index: int) -> _Field:
+        _com_call()
+        return self._items[index]
+
+    def __len__(self) -> int:
+        return self.Count
+
+    def __getitem__(self, index: int) -> _Field:
+        return self.Item(index)
+
+    def __iter__(self) -> Any:
+        # comtypes enumerates a collection through `_NewEnum`, one call to
+        # create the enumerator and one per item.
+        _com_call()
+        for f in self._items:
+            _com_call()
+            yield f
+
+
+class _Recordset(_ComObject):
+    def __init__(
+        self,
+        names: Optional[list[str]] = None,
+        types_: Optional[list[int]] = None,
+        rows: Optional[list[tuple[Any, ...]]] = None,
+    ) -> None:
+        self._names = names or []
+        self._types = types_ or []
+        self._rows = rows or []
+        self._pos = 0
+        self._state = adStateOpen if names is not None else adStateClosed
+
+    @property
+    def State(self) -> int:
+        _com_call()
+        return self._state
+
+    @property
+    def EOF(self) -> bool:
+        _com_call()
+        if self._state == adStateClosed:
+            raise RuntimeError("Operation is not allowed when the object is closed.")
+        return self._pos >= len(self._rows)
+
+    @property
+    def Fields(self) -> _Fields:
+        _com_call()
+        return _Fields(self)
+
+    def MoveNext(self) -> None:
+        _com_call()
+        self._pos += 1
+
+    def Close(self) -> None:
+        _com_call()
+        self._state = adStateClosed
+
+
+class _Parameter(_ComObject):
+    def __init__(self, name: str, type_: int, direction: int, size: int, value: Any):
+        attrs = dict(Name=name, Type=type_, Direction=direction, Size=size)
+        self.__dict__.update(attrs, Value=value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        _com_call()
+        object.__setattr__(self, name, value)
+
+
+class _Parameters(_ComObject):
+    def __init__(self) -> None:
+        self._items: list[_Parameter] = []
+
+    @property
+    def Count(self) -> int:
+        _com_call()
+        return len(self._items)
+
+    def Append(self, param: _Parameter) -> None:
+        _com_call()
+        self._items.append(param)
+
+    def Item(self, index: int) -> _Parameter:
+        _com_call()
+        return self._items[index]
+
+    def __len__(self) -> int:
+        return self.Count
+
+    def __getitem__(self, index: int) -> _Parameter:
+        return self.Item(index)
+
+
+class _Ref:
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+
+class Command(_ComObject):
+    ActiveConnection: "Connection"
+    CommandTimeout: int
+    CommandType: int
+    CommandText: str
+    Prepared: bool
+
+    def __init__(self) -> None:
+        object.__setattr__(self, "_params", _Parameters())
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        _com_call()
+        object.__setattr__(self, name, value)
+
+    @property
+    def Parameters(self) -> _Parameters:
+        _com_call()
+        return self._params
+
+    def CreateParameter(
+        self,
+        Name: str = "",
+        Type: int = 0,
+        Direction: int = 1,
+        Size: int = 0,
+        Value: Any = None,
+    ) -> _Parameter:
+        _com_call()
+        return _Parameter(Name, Type, Direction, Size, Value)
+
+    def Execute(self, *args: Any) -> tuple[list[_Ref], _Recordset]:
+        _com_call()
+        text = self.CommandText
+        if text.lstrip()[:6].upper() != "SELECT":
+            return ([_Ref(1)], _Recordset())
+        found = [t for t in _FROM.findall(text) if t in TABLES]
+        if not found:
+            raise RuntimeError(f"unknown table in {text!r}")
+        names, types_, rows = TABLES[found[0]]
+        return ([_Ref(-1)], _Recordset(names, types_, rows))
+
+
+class Connection(_ComObject):
+    def __init__(self) -> None:
+        self._level = 0
+        self._timeout = 30
+
+    @property
+    def CommandTimeout(self) -> int:
+        _com_call()
+        return self._timeout
+
+    def Open(self, conn_str: str, user_id: str, password: str, options: int) -> None:
+        _com_call()
+        if not conn_str.startswith("Provider="):
+            raise RuntimeError("Provider cannot be found.")
+
+    def BeginTrans(self) -> int:
+        _com_call()
+        self._level += 1
+        return self._level
+
+    def CommitTrans(self) -> None:
+        _com_call()
+        self._level -= 1
+
+    def RollbackTrans(self) -> None:
+        _com_call()
+        self._level -= 1
+
+    def Close(self) -> None:
+        _com_call()
+
+
+class Catalog(_ComObject):
+    ActiveConnection: Any
+
+    def Create(self, conn_str: str) -> None:
+        _com_call()
+        conn = Connection()
+        conn.Open(conn_str, "", "", adConnectUnspecified)
+        self.ActiveConnection = conn
+
+
+def CreateObject(progid: Any, interface: Any = None) -> Any:
+    _com_call()
+    return progid()
+
+
+def add_table(name: str, rows: int, width: int) -> None:
+    """Registers a table of `rows` rows with `width` columns alternating
+    between integers and strings."""
+    names = [f"Col{i}" for i in range(width)]
+    types_ = [adInteger if i % 2 == 0 else adVarWChar for i in range(width)]
+    data = [
+        tuple(r if i % 2 == 0 else f"value{r}" for i in range(width))
+        for r in range(rows)
+    ]
+    TABLES[name] = (names, types_, data)
+
+
+# ADO enums, values as defined in msado15.dll
+adEmpty = 0
+adSmallInt = 2
+adInteger = 3
+adSingle = 4
+adDouble = 5
+adCurrency = 6
+adDate = 7
+adBSTR = 8
+adIDispatch = 9
+adError = 10
+adBoolean = 11
+adVariant = 12
+adIUnknown = 13
+adDecimal = 14
+adTinyInt = 16
+adUnsignedTinyInt = 17
+adUnsignedSmallInt = 18
+adUnsignedInt = 19
+adBigInt = 20
+adUnsignedBigInt = 21
+adFileTime = 64
+adGUID = 72
+adBinary = 128
+adChar = 129
+adWChar = 130
+adNumeric = 131
+adUserDefined = 132
+adDBDate = 133
+adDBTime = 134
+adDBTimeStamp = 135
+adChapter = 136
+adPropVariant = 138
+adVarNumeric = 139
+adVarChar = 200
+adLongVarChar = 201
+adVarWChar = 202
+adLongVarWChar = 203
+adVarBinary = 204
+adLongVarBinary = 205
+adArray = 0x2000
+adStateClosed = 0
+adStateOpen = 1
+adCmdText = 1
+adConnectUnspecified = -1
+adParamInput = 1
+adFldMayBeNull = 0x40
+adFldIsNullable = 0x20
+
+
+def _namespace(name: str, **attrs: Any) -> types.ModuleType:
+    mod = types.ModuleType(name)
+    mod.__dict__.update(attrs)
+    return mod
+
+
+def _enums() -> dict[str, Any]:
+    return {k: v for k, v in globals().items() if k.startswith("ad")}
+
+
+class VARIANT:
+    def __init__(self, value: Any = None) -> None:
+        self.vt = 0
+        self._ = types.SimpleNamespace()
+        self.decVal = types.SimpleNamespace()
+        self.value = value
+
+
+def _fake_comtypes() -> None:
+    comtypes = _namespace(
+        "comtypes",
+        COINIT_APARTMENTTHREADED=0x2,
+        CoInitializeEx=lambda flags=None: None,
+        CoUninitialize=lambda: None,
+    )
+    client = _namespace("comtypes.client", CreateObject=CreateObject)
+    automation = _namespace(
+        "comtypes.automation",
+        VARIANT=VARIANT,
+        VT_ARRAY=0x2000,
+        VT_CY=6,
+        VT_DATE=7,
+        VT_DECIMAL=14,
+        VT_UI1=17,
+    )
+    safearray = _namespace("comtypes.safearray", _midlSAFEARRAY=None)
+    comtypes.client = client  # type: ignore
+    comtypes.automation = automation  # type: ignore
+    comtypes.safearray = safearray  # type: ignore
+    sys.modules.update(
+        {
+            "comtypes": comtypes,
+            "comtypes.client": client,
+            "comtypes.automation": automation,
+            "comtypes.safearray": safearray,
+        }
+    )
+
+
+def install() -> None:
+    if "adotypes" in sys.modules:
+        raise RuntimeError("install() must be called before importing adotypes")
+    try:
+        import comtypes.client
+    except ImportError:
+        _fake_comtypes()
+    else:
+        comtypes.client.CreateObject = CreateObject  # type: ignore
+    adodb = _namespace(
+        "ADODB",
+        Connection=Connection,
+        _Connection=Connection,
+        Command=Command,
+        _Command=Command,
+        _Recordset=_Recordset,
+        Field=_Field,
+        **_enums(),
+    )
+    adox = _namespace("ADOX", Catalog=Catalog, _Catalog=Catalog)
+    sys.modules["adotypes.com_dlls"] = _namespace(
+        "adotypes.com_dlls", adodb=adodb, adox=adox
+    )
+
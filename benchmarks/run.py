@@ -0,0 +1,210 @@
+"""Runs the benchmarks against the fake ADODB provider and writes JSON.
+
+    python -m benchmarks.run --latency 0.000002 --output before.json
+    python -m benchmarks.run --latency 0.000002 --output after.json
+    python -m benchmarks.compare before.json after.json
+
+Cases that need a feature the `adotypes` under test does not have, such as
+parameters or threaded connections, are skipped, so that any commit can be
+measured.
+"""
+import argparse
+from collections.abc import Callable, Iterator
+import datetime
+import importlib.util
+import json
+import platform
+import statistics
+import sys
+import time
+from typing import Any
+
+from benchmarks import fake_adodb
+
+fake_adodb.install()
+
+import adotypes  # noqa: E402
+
+_Case = tuple[str, Callable[[], Any], int]  # name, function, operations per call
+
+CONN_STR = "Provider=Fake"
+SIZES = (10, 1000)
+WIDTHS = (2, 10)
+
+
+def _cases() -> Iterator[_Case]:
+    yield ("connect", lambda: adotypes.connect(open=CONN_STR).close(), 1)
+    conn = adotypes.connect(open=CONN_STR)
+    cursor = conn.cursor()
+    yield ("commit", conn.commit, 1)
+    yield ("rollback", conn.rollback, 1)
+    row = (1, "name", 1.5, datetime.datetime(2001, 2, 3, 4, 5, 6), b"\x00\x01")
+    stmt = "INSERT INTO T VALUES (?, ?, ?, ?, ?)"
+    # parameters used to be accepted and ignored, so look for the encoders
+    if _has_module("adotypes.encoders"):
+        yield ("execute-params", _execute(cursor, stmt, row), 1)
+        batch = [row] * 100
+        if _supports(lambda: cursor.executemany(stmt, batch[:1])):
+            yield ("executemany", _executemany(cursor, stmt, batch), len(batch))
+    factories: list[Any] = []
+    if _has_module("adotypes.rows"):
+        from adotypes import rows
+
+        factories = [rows.namedtuple_row, rows.slotted_row]
+    threaded_cursor = None
+    if hasattr(adotypes, "ThreadedConnection"):
+        threaded = adotypes.connect(open=CONN_STR, threaded=True)
+        threaded_cursor = threaded.cursor()
+    for size in SIZES:
+        for width in WIDTHS:
+            table = f"T{size}x{width}"
+            fake_adodb.add_table(table, size, width)
+            stmt = f"SELECT * FROM {table}"
+            yield (f"execute[{table}]", _execute(cursor, stmt), 1)
+            yield (f"fetchone[{table}]", _fetchone(cursor, stmt), size)
+            yield (f"fetchmany[{table}]", _fetchmany(cursor, stmt), size)
+            yield (f"fetchall[{table}]", _fetchall(cursor, stmt), size)
+            for factory in factories:
+                yield (
+                    f"fetchall-{factory.__name__}[{table}]",
+                    _fetchall(_with_factory(conn, factory), stmt),
+                    size,
+                )
+            if threaded_cursor is not None:
+                yield (
+                    f"threaded-fetchone[{table}]",
+                    _fetchone(threaded_cursor, stmt),
+                    size,
+                )
+
+
+def _has_module(name: str) -> bool:
+    return importlib.util.find_spec(name) is not None
+
+
+def _supports(fn: Callable[[], Any]) -> bool:
+    try:
+        fn()
+    except NotImplementedError:
+        return False
+    return True
+
+
+# `adotypes.Cursor` or `adotypes.ThreadedCursor`, if the latter exists
+_AnyCursor = Any
+
+
+def _with_factory(conn: adotypes.Connection, factory: Any) -> adotypes.Cursor:
+    cursor = conn.cursor()
+    cursor.row_factory = factory
+    return cursor
+
+
+def _execute(cursor: _AnyCursor, stmt: str, *args: Any) -> Callable[[], None]:
+    def run() -> None:
+        cursor.execute(stmt, *args)
+
+    return run
+
+
+def _executemany(
+    cursor: _AnyCursor, stmt: str, batch: list[Any]
+) -> Callable[[], None]:
+    def run() -> None:
+        cursor.executemany(stmt, batch)
+
+    return run
+
+
+def _fetchone(cursor: _AnyCursor, stmt: str) -> Callable[[], None]:
+    def run() -> None:
+        cursor.execute(stmt)
+        while cursor.fetchone() is not None:
+            pass
+
+    return run
+
+
+def _fetchmany(cursor: _AnyCursor, stmt: str) -> Callable[[], None]:
+    def run() -> None:
+        cursor.execute(stmt)
+        while cursor.fetchmany(100):
+            pass
+
+    return run
+
+
+def _fetchall(cursor: _AnyCursor, stmt: str) -> Callable[[], None]:
+    def run() -> None:
+        cursor.execute(stmt)
+        cursor.fetchall()
+
+    return run
+
+
+def _measure(fn: Callable[[], Any], repeat: int, min_time: float) -> list[float]:
+    # calibrate the number of loops so that each sample takes `min_time`
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        loops *= 2
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        samples.append((time.perf_counter() - start) / loops)
+    return samples
+
+
+def main(argv: Any = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", "-o", help="JSON file; stdout by default")
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="seconds spent per COM call"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05)
+    parser.add_argument("--filter", "-k", default="", help="substring of names")
+    args = parser.parse_args(argv)
+    fake_adodb.LATENCY = args.latency
+    results = {}
+    for name, fn, ops in _cases():
+        if args.filter not in name:
+            continue
+        fake_adodb.CALLS = 0
+        fn()
+        com_calls = fake_adodb.CALLS
+        samples = _measure(fn, args.repeat, args.min_time)
+        results[name] = {
+            "median": statistics.median(samples),
+            "min": min(samples),
+            "max": max(samples),
+            "per_op": statistics.median(samples) / ops,
+            "com_calls": com_calls,
+        }
+        print(f"{name:<36} {results[name]['median'] * 1e6:12.1f} us", file=sys.stderr)
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "adotypes": adotypes.__version__,
+            "latency": args.latency,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+
+
+if __name__ == "__main__":
+    main()
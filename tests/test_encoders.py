@@ -0,0 +1,130 @@
+import datetime
+import decimal
+
+from comtypes.automation import VT_ARRAY, VT_CY, VT_DECIMAL, VT_UI1
+import pytest
+
+import adotypes
+from adotypes import com_dlls, encoders
+
+
+class Test_OleDate:
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            (datetime.datetime(1899, 12, 30), 0.0),
+            (datetime.datetime(1899, 12, 29, 6), -1.25),
+            (datetime.datetime(1900, 1, 1), 2.0),
+            (datetime.datetime(2000, 1, 1, 12), 36526.5),
+        ],
+    )
+    def test_datetime(self, value, expected):
+        ad_type, _, v = encoders.encode(value)
+        assert ad_type == com_dlls.adodb.adDate
+        assert v._.VT_DATE == expected
+
+    def test_date(self):
+        _, _, v = encoders.encode(datetime.date(2000, 1, 1))
+        assert v._.VT_DATE == 36526.0
+
+    def test_time(self):
+        _, _, v = encoders.encode(datetime.time(18))
+        assert v._.VT_DATE == 0.75
+
+
+class Test_Encode:
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            (None, com_dlls.adodb.adVarWChar),
+            (True, com_dlls.adodb.adBoolean),
+            (1, com_dlls.adodb.adInteger),
+            (2**40, com_dlls.adodb.adBigInt),
+            (1.5, com_dlls.adodb.adDouble),
+            ("abc", com_dlls.adodb.adVarWChar),
+            ("a" * 5000, com_dlls.adodb.adLongVarWChar),
+            (decimal.Decimal("1.2345"), com_dlls.adodb.adCurrency),
+            (decimal.Decimal("1.23456"), com_dlls.adodb.adDecimal),
+            (decimal.Decimal(2**63), com_dlls.adodb.adDecimal),
+            (b"abc", com_dlls.adodb.adLongVarBinary),
+            (memoryview(b"abc"), com_dlls.adodb.adLongVarBinary),
+        ],
+    )
+    def test_type(self, value, expected):
+        assert encoders.encode(value)[0] == expected
+
+    def test_currency(self):
+        _, _, v = encoders.encode(decimal.Decimal("1.2345"))
+        assert v.vt == VT_CY and v._.VT_CY == 12345
+
+    @pytest.mark.parametrize(
+        "value, scale, mantissa, digits",
+        [
+            ("1.23456", 5, 123456, (6, 5)),
+            ("-0.000012", 6, 12, (6, 6)),
+            ("1E+20", 0, 10**20, (21, 0)),
+            ("1.0000000000000000000000000000000", 28, 10**28, (29, 28)),
+        ],
+    )
+    def test_decimal(self, value, scale, mantissa, digits):
+        _, _, v = encoders.encode(decimal.Decimal(value))
+        assert v.vt == VT_DECIMAL
+        assert v.decVal.scale == scale
+        assert v.decVal.sign == (0x80 if value.startswith("-") else 0)
+        assert v.decVal.Hi32 << 64 | v.decVal.Lo64 == mantissa
+        assert encoders.decimal_digits(v) == digits
+
+    @pytest.mark.parametrize(
+        "value", ["NaN", "Infinity", "1E+29", "0.00000000000000000000000000001"]
+    )
+    def test_decimal_out_of_range(self, value):
+        with pytest.raises(adotypes.DataError):
+            encoders.encode(decimal.Decimal(value))
+
+    @pytest.mark.parametrize(
+        "value, expected", [("", 1), ("abc", 3), ("\u00e9", 1), ("a\U0001f600", 3)]
+    )
+    def test_str_size(self, value, expected):
+        assert encoders.encode(value)[1] == expected
+
+    def test_binary(self):
+        _, size, v = encoders.encode(bytearray(b"abc"))
+        assert size == 3
+        assert bytes(v.value) == b"abc"
+
+    def test_empty_binary(self):
+        _, size, v = encoders.encode(b"")
+        assert size == 1
+        assert v.vt == VT_ARRAY | VT_UI1
+        assert bytes(v.value) == b""
+
+    def test_subclass_is_cached(self):
+        class MyDatetime(datetime.datetime):
+            pass
+
+        assert encoders.get_encoder(MyDatetime) is encoders.get_encoder(
+            datetime.datetime
+        )
+        assert MyDatetime in encoders._CACHE
+
+    def test_unsupported(self):
+        with pytest.raises(adotypes.NotSupportedError):
+            encoders.encode(object())
+
+
+class Test_Constructors:
+    def test_constructors(self):
+        assert adotypes.Date(2001, 2, 3) == datetime.date(2001, 2, 3)
+        assert adotypes.Time(4, 5, 6) == datetime.time(4, 5, 6)
+        assert adotypes.Timestamp(2001, 2, 3, 4, 5, 6) == datetime.datetime(
+            2001, 2, 3, 4, 5, 6
+        )
+        assert adotypes.Binary(bytearray(b"abc")) == b"abc"
+
+    def test_from_ticks(self):
+        ts = datetime.datetime(2001, 2, 3, 4, 5, 6).timestamp()
+        assert adotypes.DateFromTicks(ts) == datetime.date(2001, 2, 3)
+        assert adotypes.TimeFromTicks(ts) == datetime.time(4, 5, 6)
+        assert adotypes.TimestampFromTicks(ts) == datetime.datetime(
+            2001, 2, 3, 4, 5, 6
+        )
@@ -0,0 +1,56 @@
+import pytest
+
+from adotypes import rows
+
+
+_DESCRIPTION = [
+    ("Id", 3, None, 4, 10, 255, True),
+    ("Name", 202, None, 255, 255, 255, True),
+    ("first name", 202, None, 255, 255, 255, True),
+]
+
+
+class Test_NamedTupleRow:
+    def test_row(self):
+        make = rows.namedtuple_row(_DESCRIPTION)
+        row = make(iter([1, "John", "Lennon"]))
+        assert row == (1, "John", "Lennon")
+        assert row.Id == 1
+        assert row.Name == "John"
+        assert row._2 == "Lennon"
+
+    def test_class_is_shared(self):
+        a = rows.namedtuple_row(_DESCRIPTION)([1, "John", "Lennon"])
+        b = rows.namedtuple_row(list(_DESCRIPTION))([2, "Paul", "McCartney"])
+        assert type(a) is type(b)
+
+
+class Test_SlottedRow:
+    def test_row(self):
+        make = rows.slotted_row(_DESCRIPTION)
+        row = make(iter([1, "John", "Lennon"]))
+        assert row == (1, "John", "Lennon")
+        assert row.Id == 1
+        assert row["Name"] == "John"
+        assert row["first name"] == "Lennon"
+        assert row[-1] == "Lennon"
+        assert list(row) == [1, "John", "Lennon"]
+        assert dict(row) == {"Id": 1, "Name": "John", "first name": "Lennon"}
+        assert repr(row) == "Row(Id=1, Name='John', first name='Lennon')"
+
+    def test_no_instance_dict(self):
+        row = rows.slotted_row(_DESCRIPTION)([1, "John", "Lennon"])
+        assert not hasattr(row, "__dict__")
+        with pytest.raises(AttributeError):
+            row.Id = 2
+
+    def test_class_is_shared(self):
+        a = rows.slotted_row(_DESCRIPTION)([1, "John", "Lennon"])
+        b = rows.slotted_row(_DESCRIPTION)([2, "Paul", "McCartney"])
+        assert type(a) is type(b)
+        assert a._index is b._index
+
+    def test_unknown_column(self):
+        row = rows.slotted_row(_DESCRIPTION)([1, "John", "Lennon"])
+        with pytest.raises(KeyError):
+            row["Age"]
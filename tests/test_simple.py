@@ -1,10 +1,13 @@
+import asyncio
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import comtypes.client
 import pytest
 
 import adotypes
+from adotypes import aio, parallel, rows, tracing
 from adotypes import com_dlls
 
 
@@ -182,3 +185,283 @@ class Test_CRUD:
         with conn.cursor() as c:
             c.execute("SELECT Id, Name FROM MyTable")
             assert c.fetchall() == [(2, "Ringo"), (3, "Paul"), (4, "George")]
+
+    def test_description(self, conn: adotypes.Connection):
+        with conn.cursor() as c:
+            assert c.description is None
+            c.execute("SELECT Id, Name FROM MyTable")
+            assert [d[0] for d in c.description] == ["Id", "Name"]
+            assert c.description[0][1] == com_dlls.adodb.adInteger
+            c.execute("INSERT INTO MyTable (Id, Name) VALUES (1, 'John')")
+            assert c.description is None
+
+    def test_row_factory(self, conn: adotypes.Connection):
+        conn.cursor().execute("INSERT INTO MyTable (Id, Name) VALUES (1, 'John')")
+        conn.row_factory = rows.slotted_row
+        with conn.cursor() as c:
+            c.execute("SELECT Id, Name FROM MyTable")
+            row = c.fetchone()
+            assert row.Id == 1
+            assert row["Name"] == "John"
+            c.row_factory = rows.namedtuple_row
+            c.execute("SELECT Id, Name FROM MyTable")
+            assert c.fetchall()[0].Name == "John"
+
+    def test_parameters(self, conn: adotypes.Connection):
+        with conn.cursor() as c:
+            c.execute("INSERT INTO MyTable (Id, Name) VALUES (?, ?)", (1, "John"))
+            c.executemany(
+                "INSERT INTO MyTable (Id, Name) VALUES (?, ?)",
+                [(2, "Ringo"), (3, None), (4, "George Harrison")],
+            )
+            c.execute("SELECT Id, Name FROM MyTable WHERE Id > ?", [1])
+            assert c.fetchall() == [(2, "Ringo"), (3, None), (4, "George Harrison")]
+
+    def test_executemany_nothing(self, conn: adotypes.Connection):
+        with conn.cursor() as c:
+            c.execute("INSERT INTO MyTable (Id, Name) VALUES (1, 'John')")
+            c.execute("SELECT Id, Name FROM MyTable")
+            c.executemany("INSERT INTO MyTable (Id, Name) VALUES (?, ?)", [])
+            assert c.description is None
+            with pytest.raises(adotypes.ProgrammingError):
+                c.fetchone()
+
+
+class Test_Threaded:
+    @pytest.fixture
+    def conn(self, db_fspath: Path) -> Iterator[adotypes.ThreadedConnection]:
+        with adotypes.connect(
+            open=f"Provider=Microsoft.ACE.OLEDB.12.0;Data Source={db_fspath}",
+            threaded=True,
+            blocksize=2,
+        ) as conn:
+            conn.cursor().execute("CREATE TABLE MyTable (Id INT, Name TEXT)")
+            yield conn
+        conn.close()
+
+    def test_shared_across_threads(self, conn: adotypes.ThreadedConnection):
+        def insert(i: int) -> None:
+            conn.cursor().execute(f"INSERT INTO MyTable (Id, Name) VALUES ({i}, 'x')")
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(insert, range(5)))
+        with conn.cursor() as c:
+            c.execute("SELECT Id FROM MyTable ORDER BY Id")
+            assert c.fetchone() == (0,)
+            assert c.fetchmany(3) == [(1,), (2,), (3,)]
+            assert c.fetchall() == [(4,)]
+            assert c.fetchone() is None
+
+    def test_rollback(self, conn: adotypes.ThreadedConnection):
+        conn.commit()
+        orig = conn.run(lambda c: len(c.adox_catalog.Tables))
+        conn.cursor().execute("CREATE TABLE OtherTable (Id INT)")
+        assert orig + 1 == conn.run(lambda c: len(c.adox_catalog.Tables))
+        conn.rollback()
+        assert orig == conn.run(lambda c: len(c.adox_catalog.Tables))
+
+
+class Test_Aio:
+    def _connect(self, fspath: str) -> "asyncio.Future[aio.AsyncConnection]":
+        return aio.connect(
+            open=f"Provider=Microsoft.ACE.OLEDB.12.0;Data Source={fspath}",
+            blocksize=2,
+        )
+
+    def test_async_iteration(self, db_fspath):
+        async def run() -> list[tuple[int, str]]:
+            async with await self._connect(db_fspath) as conn:
+                c = await conn.cursor()
+                await c.execute("CREATE TABLE MyTable (Id INT, Name TEXT)")
+                for i in range(5):
+                    await c.execute(f"INSERT INTO MyTable (Id, Name) VALUES ({i}, 'x')")
+            conn = await self._connect(db_fspath)
+            async with await conn.cursor() as c:
+                await c.execute("SELECT Id, Name FROM MyTable ORDER BY Id")
+                result = [row async for row in c]
+            await conn.close()
+            return result
+
+        assert asyncio.run(run()) == [(i, "x") for i in range(5)]
+
+    def test_cancelled_fetch(self, db_fspath):
+        async def run() -> list[tuple[int, str]]:
+            async with await self._connect(db_fspath) as conn:
+                c = await conn.cursor()
+                await c.execute("CREATE TABLE MyTable (Id INT, Name TEXT)")
+                for i in range(9):
+                    await c.execute(f"INSERT INTO MyTable (Id, Name) VALUES ({i}, 'x')")
+                await c.execute("SELECT Id, Name FROM MyTable ORDER BY Id")
+                first = await c.fetchone()
+                task = asyncio.ensure_future(c.fetchmany(4))
+                await asyncio.sleep(0)  # let it wait for the next block
+                task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+                return [first] + [row async for row in c]
+
+        assert asyncio.run(run()) == [(i, "x") for i in range(9)]
+
+    def test_description_and_stats(self, db_fspath):
+        async def run() -> None:
+            async with await self._connect(db_fspath) as conn:
+                c = await conn.cursor()
+                assert await c.get_description() is None
+                await c.execute("CREATE TABLE MyTable (Id INT, Name TEXT)")
+                await c.execute("SELECT Id, Name FROM MyTable")
+                description = await c.get_description()
+                assert [d[0] for d in description] == ["Id", "Name"]
+                stats = await conn.get_stats()
+                assert stats.statements["execute"] == 2
+
+        asyncio.run(run())
+
+    def test_rollback_when_exiting(self, db_fspath):
+        async def run() -> None:
+            async with await self._connect(db_fspath) as conn:
+                c = await conn.cursor()
+                await c.execute("CREATE TABLE MyTable (Id INT, Name TEXT)")
+                _ = 1 / 0
+
+        with pytest.raises(ZeroDivisionError):
+            asyncio.run(run())
+        with adotypes.connect(
+            open=f"Provider=Microsoft.ACE.OLEDB.12.0;Data Source={db_fspath}"
+        ) as conn:
+            names = [t.Name for t in conn.adox_catalog.Tables]
+            assert "MyTable" not in names
+
+
+class Test_Parallel:
+    @pytest.fixture
+    def conn_str(self, db_fspath: str) -> str:
+        conn_str = f"Provider=Microsoft.ACE.OLEDB.12.0;Data Source={db_fspath}"
+        with adotypes.connect(open=conn_str) as conn:
+            c = conn.cursor()
+            c.execute("CREATE TABLE MyTable (Id INT, Name TEXT)")
+            for i in range(10):
+                c.execute(f"INSERT INTO MyTable (Id, Name) VALUES ({i}, 'x')")
+            c.execute("INSERT INTO MyTable (Id, Name) VALUES (NULL, 'y')")
+        return conn_str
+
+    def test_ordered(self, conn_str: str):
+        rows = parallel.extract(
+            conn_str, "SELECT Id, Name FROM MyTable", "Id", partitions=3, workers=2
+        )
+        ids = [r[0] for r in rows]
+        assert None in ids
+        ids.remove(None)
+        assert ids == sorted(ids) == list(range(10))
+
+    def test_unordered(self, conn_str: str):
+        rows = parallel.extract(
+            conn_str, "SELECT Id FROM MyTable", "Id", partitions=4, ordered=False
+        )
+        assert len(list(rows)) == 11
+
+    def test_failure(self, conn_str: str):
+        with pytest.raises(adotypes.DatabaseError):
+            list(parallel.extract(conn_str, "SELECT Id FROM Nope", "Id", bounds=(0, 9)))
+
+    def test_all_keys_null(self, conn_str: str):
+        rows = parallel.extract(
+            conn_str, "SELECT Id FROM MyTable WHERE Id IS NULL", "Id", partitions=3
+        )
+        assert list(rows) == [(None,)]
+
+    def test_currency_key(self, conn_str: str):
+        with adotypes.connect(open=conn_str) as conn:
+            c = conn.cursor()
+            c.execute("CREATE TABLE Prices (Price CURRENCY)")
+            for i in range(10):
+                c.execute(f"INSERT INTO Prices (Price) VALUES ({i}.25)")
+        rows = parallel.extract(conn_str, "SELECT Price FROM Prices", "Price", 3)
+        assert len(list(rows)) == 10
+
+
+class Test_Tracing:
+    class _Recorder(tracing.Hook):
+        def __init__(self) -> None:
+            self.before_events: list[tracing.TraceEvent] = []
+            self.after_events: list[tracing.TraceEvent] = []
+
+        def before(self, event: tracing.TraceEvent) -> None:
+            self.before_events.append(event)
+
+        def after(self, event: tracing.TraceEvent) -> None:
+            self.after_events.append(event)
+
+    @pytest.fixture
+    def recorder(self) -> Iterator["Test_Tracing._Recorder"]:
+        recorder = self._Recorder()
+        tracing.register(recorder)
+        yield recorder
+        tracing.unregister(recorder)
+
+    def test_hooks(self, db_fspath: str, recorder: "Test_Tracing._Recorder"):
+        with adotypes.connect(
+            open=f"Provider=Microsoft.ACE.OLEDB.12.0;Data Source={db_fspath}"
+        ) as conn:
+            c = conn.cursor()
+            c.execute("CREATE TABLE MyTable (Id INT, Name TEXT)")
+            c.execute("INSERT INTO MyTable (Id, Name) VALUES (1, 'John')")
+            c.execute("SELECT Id, Name FROM MyTable")
+            assert c.fetchall() == [(1, "John")]
+        kinds = ["connect", "execute", "execute", "execute", "fetch", "commit"]
+        assert [e.kind for e in recorder.before_events] == kinds
+        assert [e.kind for e in recorder.after_events] == kinds
+        insert = recorder.after_events[2]
+        assert insert.fingerprint == "INSERT INTO MyTable (Id, Name) VALUES (?, ?)"
+        assert insert.elapsed is not None and insert.com_calls > 0
+        assert recorder.after_events[4].rows == 1
+        stats = conn.stats
+        assert stats.statements["execute"] == 3
+        assert sum(stats.latency["execute"]) == 3
+        assert stats.rows_fetched == 1
+
+    def test_encode_failure(
+        self, db_fspath: str, recorder: "Test_Tracing._Recorder"
+    ):
+        with adotypes.connect(
+            open=f"Provider=Microsoft.ACE.OLEDB.12.0;Data Source={db_fspath}"
+        ) as conn:
+            c = conn.cursor()
+            with pytest.raises(adotypes.NotSupportedError):
+                c.execute("SELECT ?", [object()])
+        event = recorder.after_events[1]
+        assert event.kind == "execute"
+        assert isinstance(event.error, adotypes.NotSupportedError)
+        assert conn.stats.statements["execute"] == 1
+
+    def test_description_calls(
+        self, db_fspath: str, recorder: "Test_Tracing._Recorder"
+    ):
+        with adotypes.connect(
+            open=f"Provider=Microsoft.ACE.OLEDB.12.0;Data Source={db_fspath}"
+        ) as conn:
+            c = conn.cursor()
+            c.execute("CREATE TABLE MyTable (Id INT, Name TEXT)")
+            c.execute("SELECT Id, Name FROM MyTable")
+            assert c.description is not None
+            before = conn.stats.com_calls
+            c.fetchall()
+            # the calls made by `description` are reported with the fetch
+            assert recorder.after_events[-1].com_calls > 1
+            assert conn.stats.com_calls - before == recorder.after_events[-1].com_calls
+
+    def test_commit_failure(
+        self, db_fspath: str, recorder: "Test_Tracing._Recorder"
+    ):
+        conn = adotypes.connect(
+            open=f"Provider=Microsoft.ACE.OLEDB.12.0;Data Source={db_fspath}"
+        )
+        conn.close()
+        with pytest.raises(adotypes.ProgrammingError) as excinfo:
+            conn.commit()
+        assert recorder.after_events[-1].kind == "commit"
+        assert recorder.after_events[-1].error is excinfo.value
+
+    def test_fingerprint(self):
+        assert tracing.fingerprint(
+            "SELECT * FROM T  WHERE a = 'it''s'\n AND b = 1.5 AND c = #2001-01-01#"
+        ) == "SELECT * FROM T WHERE a = ? AND b = ? AND c = ?"